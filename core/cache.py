@@ -0,0 +1,361 @@
+# ============================================================================
+# FILE: core/cache.py
+# PURPOSE: Response caches for LLM calls and tool lookups
+# ============================================================================
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
+import json
+import math
+import operator
+import os
+import sqlite3
+import threading
+import time
+
+
+# ============================================================================
+# WHY CACHE?
+# ============================================================================
+# The same prompt is often sent more than once:
+# - Retries and refinement iterations rebuild identical message lists
+# - Different architects issue the same RAG query ("VPC best practices")
+#
+# An LLM call costs seconds, a RAG query costs an embedding + vector search.
+# A dict lookup costs microseconds. So we key each call on a hash of its
+# exact inputs and reuse the answer while it is fresh.
+#
+# Exact-match by default. SemanticCache (below) adds a paraphrase-tolerant
+# layer for the few call sites where a near-identical question may safely
+# reuse an answer.
+# ============================================================================
+
+
+def make_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from arbitrary JSON-like parts.
+
+    Dicts are serialized with sorted keys so logically equal inputs
+    always hash to the same key.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share a key."""
+    return " ".join(str(query).lower().split())
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with a time-to-live.
+
+    WHY THREAD-SAFE? Tool calls and parallel graph nodes run in worker
+    threads, all sharing the module-level cache instances below.
+
+    A ttl or maxsize of 0 disables the cache (get always misses).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prefix: str, maxsize: int = 1024, ttl: float = 3600.0) -> "ResponseCache":
+        """Create a cache sized by <PREFIX>_MAXSIZE / <PREFIX>_TTL env vars."""
+        return cls(
+            maxsize=int(os.getenv(f"{prefix}_MAXSIZE", maxsize)),
+            ttl=float(os.getenv(f"{prefix}_TTL", ttl)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache over embedding vectors.
+    
+    WHY? "Build a web app on AWS" and "Design an AWS web application" are
+    the same request to an architect, yet hash to different exact keys.
+    
+    HOW IT WORKS:
+    - Entries live in namespaces; lookups never cross them. Callers put
+      everything that must match exactly (domain, services) in the namespace.
+    - Vectors are normalized on insert, so cosine similarity is a dot product.
+    - A hit needs similarity >= threshold; each namespace keeps the newest
+      `maxsize` entries.
+    
+    A flat scan in pure Python is fine at this size (a few hundred vectors)
+    and avoids a vector-index dependency. A threshold or maxsize of 0
+    disables the cache.
+    """
+    
+    def __init__(self, threshold: float = 0.93, maxsize: int = 256):
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._entries: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls, prefix: str, threshold: float = 0.93, maxsize: int = 256) -> "SemanticCache":
+        """Create a cache tuned by <PREFIX>_THRESHOLD / <PREFIX>_MAXSIZE env vars."""
+        return cls(
+            threshold=float(os.getenv(f"{prefix}_THRESHOLD", threshold)),
+            maxsize=int(os.getenv(f"{prefix}_MAXSIZE", maxsize)),
+        )
+    
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.threshold > 0
+    
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> List[float]:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def get(self, namespace: str, vector: Sequence[float]) -> Optional[Any]:
+        """Return the value of the most similar entry, or None below threshold."""
+        if not self.enabled:
+            return None
+        query = self._normalize(vector)
+        with self._lock:
+            entries = list(self._entries.get(namespace, ()))
+        
+        best_score, best_value = self.threshold, None
+        for stored, value in entries:
+            score = sum(map(operator.mul, query, stored))
+            if score >= best_score:
+                best_score, best_value = score, value
+        return best_value
+    
+    def set(self, namespace: str, vector: Sequence[float], value: Any) -> None:
+        """Store a value under its embedding, dropping the oldest when full."""
+        if not self.enabled:
+            return
+        entry = (self._normalize(vector), value)
+        with self._lock:
+            bucket = self._entries.get(namespace)
+            if bucket is None:
+                bucket = self._entries[namespace] = deque(maxlen=self.maxsize)
+            bucket.append(entry)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# ============================================================================
+# PERSISTENT TIER (SQLite)
+# ============================================================================
+# The in-process caches die with the process, but RAG answers for the same
+# documentation query stay valid across runs: "VPC CIDR sizing" returns the
+# same chunks until the collection is re-embedded. A small on-disk table
+# (stdlib sqlite3, no extra dependency) lets a new run skip those
+# embeddings + vector searches too.
+#
+# TieredCache puts an in-process ResponseCache in front: memory first, then
+# disk (a disk hit is promoted to memory); writes go to both.
+# ============================================================================
+
+
+class SQLiteCache:
+    """
+    Thread-safe persistent key/value cache with a time-to-live.
+
+    Values must be JSON-serializable. An empty path or a ttl of 0 disables
+    the cache. The database is opened on first use.
+    """
+
+    _PRUNE_EVERY = 256  # sets between deletes of expired rows
+
+    def __init__(self, path: str = "", ttl: float = 86400.0):
+        self.path = path
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._sets = 0
+
+    @classmethod
+    def from_env(cls, prefix: str, path: str = "", ttl: float = 86400.0) -> "SQLiteCache":
+        """Create a cache configured by <PREFIX>_PATH / <PREFIX>_DISK_TTL env vars."""
+        return cls(
+            path=os.getenv(f"{prefix}_PATH", path),
+            ttl=float(os.getenv(f"{prefix}_DISK_TTL", ttl)),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.ttl > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open (once) the database; callers hold self._lock."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value (wall-clock expiry, so it survives restarts)."""
+        if not self.enabled:
+            return
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                    (key, time.time() + self.ttl, payload)
+                )
+                self._sets += 1
+                if self._sets % self._PRUNE_EVERY == 0:
+                    conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def clear(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM cache")
+
+
+class TieredCache:
+    """Memory (ResponseCache) in front of disk (SQLiteCache); same get/set API."""
+
+    def __init__(self, memory: ResponseCache, disk: SQLiteCache):
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.memory.get(key)
+        if value is None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)  # promote
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.memory.set(key, value)
+        self.disk.set(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+
+# ============================================================================
+# SHARED CACHE INSTANCES
+# ============================================================================
+# LLMCACHE_TTL / LLMCACHE_MAXSIZE: responses from llm_with_tools.invoke
+# RAGCACHE_TTL / RAGCACHE_MAXSIZE: RAG_search results (in memory)
+# RAGCACHE_PATH / RAGCACHE_DISK_TTL: RAG_search results on disk, e.g.
+#   RAGCACHE_PATH=./rag_cache.sqlite (unset = memory only)
+# Set a TTL of 0 to disable.
+# ============================================================================
+
+llm_response_cache = ResponseCache.from_env("LLMCACHE", maxsize=512, ttl=3600.0)
+rag_result_cache = TieredCache(
+    ResponseCache.from_env("RAGCACHE", maxsize=1024, ttl=3600.0),
+    SQLiteCache.from_env("RAGCACHE", ttl=86400.0),
+)
+
+
+# ============================================================================
+# REQUEST-SCOPED TOOL-CALL DEDUPLICATION
+# ============================================================================
+# Within one run, the four architects (or validators) often issue the very
+# same tool call ("RAG_search: encryption at rest"). Inside a
+# tool_call_scope() block, identical (tool, args) pairs execute once and
+# later callers get the stored result.
+#
+# WHY A ContextVar? The scope follows the request, not the process: two
+# concurrent runs never see each other's entries, and everything is dropped
+# when the block exits (no TTL tuning, no stale data across runs).
+# asyncio tasks inherit it automatically; thread pools must submit work via
+# contextvars.copy_context().run (see core/execution.py).
+# ============================================================================
+
+_tool_call_results: ContextVar[Optional[Dict[str, str]]] = ContextVar("tool_call_results", default=None)
+
+
+@contextmanager
+def tool_call_scope() -> Iterator[Dict[str, str]]:
+    """
+    Deduplicate identical tool calls made inside the block.
+    
+    Nested scopes reuse the outermost one.
+    
+    Example:
+        with tool_call_scope():
+            graph.invoke(initial_state)
+    """
+    existing = _tool_call_results.get()
+    if existing is not None:
+        yield existing
+        return
+    
+    results: Dict[str, str] = {}
+    token = _tool_call_results.set(results)
+    try:
+        yield results
+    finally:
+        _tool_call_results.reset(token)
+
+
+def current_tool_call_results() -> Optional[Dict[str, str]]:
+    """The active scope's (tool, args) -> result dict, or None outside a scope."""
+    return _tool_call_results.get()
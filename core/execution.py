@@ -3,15 +3,54 @@
 # PURPOSE: Execute tools with error handling, retry logic, timeout
 # ============================================================================
 
-from typing import List, Dict, Optional
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage
-from langchain_core.tools import Tool
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import lru_cache
+from core.cache import llm_response_cache, make_key, current_tool_call_results
+import asyncio
+import math
+import random
+import re
 import time
 import logging
 
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, ToolMessage
+    from langchain_core.tools import Tool
+
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# LAZY IMPORTS
+# ============================================================================
+# langchain_core and openai pull in hundreds of submodules. They are only
+# imported when a tool loop actually runs, so importing this module (CLI
+# start-up, test discovery, worker fork) stays cheap.
+# ============================================================================
+
+
+@lru_cache(maxsize=None)
+def _provider_errors() -> Tuple[tuple, tuple]:
+    """(transient errors, rate-limit errors) exposed by the provider SDK."""
+    try:
+        import openai
+    except ImportError:  # openai ships with langchain_openai; degrade gracefully without it
+        return (), ()
+    return (
+        (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError),
+        (openai.RateLimitError,),
+    )
+
+
+def retryable_errors() -> tuple:
+    """Errors worth retrying. Anything else (bad request, auth, schema...) fails fast."""
+    return _provider_errors()[0] + (ConnectionError, TimeoutError)
+
+
 # ============================================================================
 # WHY THIS SEPARATE MODULE?
 # ============================================================================
@@ -25,13 +64,455 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
+# ============================================================================
+# TOOL DISPATCH
+# ============================================================================
+# The LLM often asks for several tools in one turn (e.g. RAG_search for EC2
+# AND web_search for Lambda pricing). Those calls are independent and
+# network-bound, so we run them concurrently: a turn then costs roughly the
+# slowest tool instead of the sum of all of them.
+#
+# Each call catches its own exceptions, so one failing tool never poisons
+# its siblings. Results are returned in the original order to keep the
+# tool_call_id <-> ToolMessage pairing intact.
+# ============================================================================
+
+
+# Upper bound for one ToolMessage (~3000 tokens). RAG_search already caps
+# each document at 2000 chars, but web_search results and errors are not.
+MAX_TOOL_RESULT_CHARS = 12000
+
+# execute_tool_calls reports failures as content, not exceptions: a final
+# message starting with one of these is a failed run, never a verdict
+INCOMPLETE_RESULT_PREFIXES = ("Error:", "Tool execution incomplete")
+
+
+def is_incomplete_result(text: str) -> bool:
+    """True for a failed run: an INCOMPLETE_RESULT_PREFIXES message or no text at all."""
+    text = str(text or "").lstrip()
+    return not text or text.startswith(INCOMPLETE_RESULT_PREFIXES)
+
+# Per-call cap for one tool call in the async loop (never more than what is
+# left of the loop's own budget). A hung search fails in seconds and the
+# model carries on without it, instead of eating the whole budget.
+MAX_TOOL_SECONDS = 60.0
+
+
+def _smart_truncate(text: str, max_len: int = 2000) -> str:
+    """
+    Keep the head (70%) and tail (30%) of long text.
+    
+    WHY HEAD+TAIL? Search results and reports put summaries first and
+    conclusions last; the middle is the most expendable part.
+    """
+    if len(text) <= max_len:
+        return text
+    head = int(max_len * 0.7)
+    tail = int(max_len * 0.3)
+    logger.debug(f"Truncating text from {len(text)} to ~{max_len} chars (head + tail)")
+    return text[:head] + "\n[... truncated ...]\n" + text[-tail:]
+
+
+def _tool_args(tool_call: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool takes 'args' dict and converts to kwargs."""
+    tool_args = tool_call.get("args", {})
+    if type(tool_args) is not dict:  # LangChain always builds plain dicts
+        tool_args = {"query": str(tool_args)}
+    return tool_args
+
+
+def _prepare_tool_call(
+    tool_call: Dict[str, Any],
+    tools: Dict[str, Tool]
+) -> Tuple[Optional[ToolMessage], Optional[Tool], Dict[str, Any], Optional[str]]:
+    """
+    Everything before running a tool call (shared by the sync and async paths).
+    
+    Returns (done, tool, tool_args, scope_key). `done` is a finished
+    ToolMessage when there is nothing to run (unknown tool, or the same call
+    already made in this request scope); otherwise run `tool` with
+    `tool_args` and hand the result to _finish_tool_call.
+    """
+    from langchain_core.messages import ToolMessage
+    
+    tool_name = tool_call["name"]
+    tool = tools.get(tool_name)  # one lookup instead of `in` + []
+    
+    if tool is None:
+        logger.warning(f"Unknown tool: {tool_name}")
+        return ToolMessage(
+            content=f"Unknown tool: {tool_name}",
+            tool_call_id=tool_call["id"]
+        ), None, {}, None
+    
+    tool_args = _tool_args(tool_call)
+    
+    # Same call already made in this request scope? Reuse its result.
+    scope = current_tool_call_results()
+    scope_key = make_key(tool_name, tool_args) if scope is not None else None
+    content = scope.get(scope_key) if scope is not None else None
+    if content is not None:
+        return ToolMessage(content=content, tool_call_id=tool_call["id"]), None, {}, None
+    
+    return None, tool, tool_args, scope_key
+
+
+def _finish_tool_call(tool_call: Dict[str, Any], scope_key: Optional[str], tool_result: Any) -> ToolMessage:
+    """Truncate a tool result, share it with the request scope, wrap it in a ToolMessage."""
+    from langchain_core.messages import ToolMessage
+    
+    content = _smart_truncate(str(tool_result), MAX_TOOL_RESULT_CHARS)
+    scope = current_tool_call_results()
+    if scope is not None and scope_key is not None:
+        scope[scope_key] = content
+    return ToolMessage(content=content, tool_call_id=tool_call["id"])
+
+
+def _failed_tool_call(tool_call: Dict[str, Any], e: Exception) -> ToolMessage:
+    """ToolMessage for a tool that raised (the LLM sees the error, the loop goes on)."""
+    from langchain_core.messages import ToolMessage
+    
+    logger.error(f"Tool {tool_call['name']} failed: {e}")
+    return ToolMessage(
+        content=_smart_truncate(f"Error: {str(e)}", MAX_TOOL_RESULT_CHARS),
+        tool_call_id=tool_call["id"]
+    )
+
+
+def _invoke_tool_call(tool_call: Dict[str, Any], tools: Dict[str, Tool]) -> ToolMessage:
+    """Execute a single tool call and wrap the outcome in a ToolMessage."""
+    try:
+        done, tool, tool_args, scope_key = _prepare_tool_call(tool_call, tools)
+        if done is not None:
+            return done
+        return _finish_tool_call(tool_call, scope_key, tool.invoke(tool_args))
+    except Exception as e:
+        return _failed_tool_call(tool_call, e)
+
+
+async def _ainvoke_tool_call(tool_call: Dict[str, Any], tools: Dict[str, Tool]) -> ToolMessage:
+    """Async twin of _invoke_tool_call (uses Tool.ainvoke)."""
+    try:
+        done, tool, tool_args, scope_key = _prepare_tool_call(tool_call, tools)
+        if done is not None:
+            return done
+        return _finish_tool_call(tool_call, scope_key, await tool.ainvoke(tool_args))
+    except Exception as e:
+        return _failed_tool_call(tool_call, e)
+
+
+# ============================================================================
+# RETRY / BACKOFF
+# ============================================================================
+# Plain 2**attempt backoff makes every worker that hit a rate limit at the
+# same moment retry at the same moment too (thundering herd). "Full jitter"
+# picks a random delay in [0, min(cap, base * 2**attempt)] instead.
+#
+# After a 429 we also remember, per model, until when it is cooling down.
+# Other calls for that model wait out the cooldown BEFORE sending a request
+# that would just be rejected again.
+# ============================================================================
+
+_rate_limited_until: Dict[str, float] = {}
+
+
+def _model_id(llm) -> str:
+    """Best-effort model name of a (possibly tool-bound) LangChain chat model."""
+    bound = getattr(llm, "bound", llm)
+    return getattr(bound, "model_name", None) or getattr(bound, "model", None) or type(bound).__name__
+
+
+def _backoff_delay(attempt: int, cap: float = 60.0, base: float = 1.0) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+# Event-loop timers may fire up to one clock tick early; a wait_for timeout
+# within this margin of the deadline counts as the deadline
+_DEADLINE_SLACK = 0.05
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until a time.monotonic() deadline (never negative)."""
+    return max(0.0, deadline - time.monotonic())
+
+
+def _cooldown_remaining(model: str) -> float:
+    """Seconds left before this model may be called again after a 429."""
+    return max(0.0, _rate_limited_until.get(model, 0.0) - time.monotonic())
+
+
+def _note_retryable_failure(model: str, error: Exception, wait_time: float) -> None:
+    """Start a shared cooldown for the model if the failure was a rate limit."""
+    if isinstance(error, _provider_errors()[1]):
+        _rate_limited_until[model] = max(
+            _rate_limited_until.get(model, 0.0),
+            time.monotonic() + wait_time
+        )
+
+
+# ============================================================================
+# HISTORY COMPACTION
+# ============================================================================
+# Every turn re-sends the whole message list, so big tool outputs from turn 1
+# are paid for again on turns 2, 3, ... (quadratic token growth per run).
+# Once the history exceeds a character budget (~4 chars per token), older
+# ToolMessages are shrunk to a short excerpt, oldest first.
+#
+# What is never touched:
+# - The leading System/Human messages (stable prefix -> provider prompt cache)
+# - The tool outputs of the latest turn (the LLM hasn't seen them yet)
+# ToolMessages are replaced, not dropped, so every tool_call_id keeps its
+# answer (the OpenAI API rejects unanswered tool calls).
+# ============================================================================
+
+_ELIDED_MARKER = "[Earlier tool output shortened to save context]\n"
+_ELIDED_EXCERPT_CHARS = 300
+
+
+def _compact_history(messages: List, char_budget: Optional[int]) -> None:
+    """Shrink older ToolMessages in place until the history fits char_budget."""
+    if not char_budget:
+        return
+    
+    total = sum(len(str(getattr(m, "content", ""))) for m in messages)
+    if total <= char_budget:
+        return
+    
+    from langchain_core.messages import ToolMessage
+    
+    last_ai_index = max(
+        (i for i, m in enumerate(messages) if getattr(m, "type", None) == "ai"),
+        default=-1
+    )
+    for i in range(last_ai_index):
+        msg = messages[i]
+        if getattr(msg, "type", None) != "tool":
+            continue
+        content = str(msg.content)
+        if content.startswith(_ELIDED_MARKER) or len(content) <= _ELIDED_EXCERPT_CHARS:
+            continue
+        
+        shortened = _ELIDED_MARKER + content[:_ELIDED_EXCERPT_CHARS] + "..."
+        messages[i] = ToolMessage(content=shortened, tool_call_id=msg.tool_call_id)
+        total -= len(content) - len(shortened)
+        if total <= char_budget:
+            break
+    
+    logger.debug(f"Compacted tool history to ~{total} chars (budget {char_budget})")
+
+
+def _llm_cache_key(llm_with_tools, messages: List) -> str:
+    """
+    Cache key for one LLM turn: model settings + bind kwargs + full message list.
+    
+    The bind kwargs hold the full tool schemas (name, description,
+    parameters) and call options such as parallel_tool_calls; the model's
+    identifying params hold the model name, temperature, max_tokens etc. A
+    changed tool signature or a differently configured model therefore never
+    replays an old turn.
+    
+    Tool calls and tool_call_ids are part of the key, so a replayed turn
+    only hits when the whole conversation so far is identical.
+    """
+    bound = getattr(llm_with_tools, "bound", llm_with_tools)
+    settings = getattr(bound, "_identifying_params", None) or _model_id(llm_with_tools)
+    bind_kwargs = getattr(llm_with_tools, "kwargs", None) or {}
+    
+    history = [
+        (
+            getattr(m, "type", type(m).__name__),
+            getattr(m, "content", ""),
+            getattr(m, "tool_calls", None),
+            getattr(m, "tool_call_id", None),
+        )
+        for m in messages
+    ]
+    return make_key(settings, bind_kwargs, history)
+
+
+def run_tool_calls(tool_calls: List[Dict[str, Any]], tools: Dict[str, Tool]) -> List[ToolMessage]:
+    """
+    Execute all tool calls from one LLM turn concurrently (thread pool).
+    
+    Returns ToolMessages in the same order as tool_calls.
+    """
+    if len(tool_calls) == 1:
+        return [_invoke_tool_call(tool_calls[0], tools)]
+    
+    # Each worker runs in a copy of the caller's context so the request-scoped
+    # tool cache (a ContextVar) is visible inside the pool threads.
+    with ThreadPoolExecutor(max_workers=len(tool_calls)) as pool:
+        futures = [
+            pool.submit(copy_context().run, _invoke_tool_call, tool_call, tools)
+            for tool_call in tool_calls
+        ]
+        return [future.result() for future in futures]
+
+
+async def arun_tool_calls(
+    tool_calls: List[Dict[str, Any]],
+    tools: Dict[str, Tool],
+    timeout: Optional[float] = None
+) -> List[ToolMessage]:
+    """
+    Async version of run_tool_calls using asyncio.gather.
+    
+    timeout bounds every tool call of the turn (wall-clock of the turn is the
+    slowest call, so one hung search can't eat the whole loop budget). A call
+    that runs out of time comes back as an "Error: ..." ToolMessage.
+    """
+    from langchain_core.messages import ToolMessage
+    
+    calls = (_ainvoke_tool_call(tool_call, tools) for tool_call in tool_calls)
+    if timeout is not None:
+        calls = (asyncio.wait_for(call, timeout) for call in calls)
+    results = await asyncio.gather(*calls, return_exceptions=True)
+    
+    tool_messages = []
+    for tool_call, result in zip(tool_calls, results):
+        if isinstance(result, asyncio.TimeoutError):
+            logger.warning(f"Tool {tool_call['name']} timed out after {timeout:.1f}s")
+            result = ToolMessage(
+                content=f"Error: {tool_call['name']} timed out after {timeout:.1f}s",
+                tool_call_id=tool_call["id"]
+            )
+        elif isinstance(result, BaseException):
+            # Only reachable on cancellation - _ainvoke_tool_call catches Exception
+            result = ToolMessage(content=f"Error: {str(result)}", tool_call_id=tool_call["id"])
+        tool_messages.append(result)
+    return tool_messages
+
+
+class _ToolLoop:
+    """
+    Bookkeeping shared by execute_tool_calls and execute_tool_calls_async.
+    
+    The two loops only differ in how they call the LLM and the tools
+    (invoke + thread pool vs ainvoke + gather) and how they sleep. The
+    deadline, response cache, retry decisions and message history live here,
+    so a change to any of them applies to both.
+    """
+    
+    def __init__(
+        self,
+        messages: List,
+        llm_with_tools,
+        timeout: Optional[float],
+        retry_attempts: int,
+        backoff_cap: float,
+        history_char_budget: Optional[int]
+    ):
+        self.messages = messages
+        self.llm_with_tools = llm_with_tools
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.backoff_cap = backoff_cap
+        self.history_char_budget = history_char_budget
+        # One monotonic deadline shared by LLM calls, retries and backoff sleeps
+        self.deadline = time.monotonic() + timeout if timeout else math.inf
+        self.model = _model_id(llm_with_tools)
+        self.cache_key: Optional[str] = None
+        self.final_response = None
+    
+    def expired(self) -> bool:
+        """True (and logged) once the overall budget is spent."""
+        if time.monotonic() >= self.deadline:
+            logger.warning(f"Timeout after {self.timeout}s")
+            return True
+        return False
+    
+    def cached_response(self):
+        """Identical conversation seen recently? Reuse the answer."""
+        self.cache_key = _llm_cache_key(self.llm_with_tools, self.messages)
+        return llm_response_cache.get(self.cache_key)
+    
+    def cooldown_wait(self) -> Optional[float]:
+        """
+        Seconds to wait out a shared rate-limit cooldown before the next
+        call (0.0 if there is none), or None if it outlasts the budget.
+        """
+        cooldown = _cooldown_remaining(self.model)
+        if not cooldown:
+            return 0.0
+        if cooldown >= _remaining(self.deadline):
+            logger.warning(f"{self.model} rate limited beyond the {self.timeout}s budget")
+            return None
+        logger.info(f"{self.model} is rate limited, waiting {cooldown:.1f}s")
+        return cooldown
+    
+    def retry_wait(self, e: Exception, attempt: int) -> Optional[float]:
+        """
+        Backoff before retrying a transient LLM failure (jittered
+        exponential), or None to give up: attempts or budget used up.
+        """
+        sleep_for = _remaining(self.deadline)
+        if attempt < self.retry_attempts and sleep_for > 0:
+            wait_time = min(_backoff_delay(attempt, cap=self.backoff_cap), sleep_for)
+            _note_retryable_failure(self.model, e, wait_time)
+            logger.warning(f"Attempt {attempt+1} failed, retrying in {wait_time:.1f}s: {e}")
+            return wait_time
+        if attempt < self.retry_attempts:
+            logger.warning(f"Timeout after {self.timeout}s, not retrying: {e}")
+        else:
+            logger.error(f"All {self.retry_attempts+1} attempts failed: {e}")
+        return None
+    
+    def record(self, response, fresh: bool) -> Optional[List[Dict[str, Any]]]:
+        """
+        Take in this turn's response (caching it if fresh).
+        
+        Returns the tool calls to run before the next turn, or None when
+        the loop is over (final answer or empty response).
+        """
+        if fresh and response is not None:
+            llm_response_cache.set(self.cache_key, response)
+        
+        # getattr with a default instead of hasattr + attribute access
+        if not response or getattr(response, "content", None) is None:
+            logger.warning("Empty response from LLM")
+            return None
+        # Check if LLM wants to call tools
+        tool_calls = getattr(response, "tool_calls", None)
+        if not tool_calls:
+            # LLM didn't call a tool - it's done!
+            self.final_response = response
+            return None
+        
+        self.messages.append(response)  # Add LLM response
+        return tool_calls
+    
+    def add_tool_results(self, tool_messages: List[ToolMessage]) -> None:
+        """Append this turn's tool outputs and keep the history within budget."""
+        self.messages.extend(tool_messages)
+        _compact_history(self.messages, self.history_char_budget)
+    
+    def result(self) -> AIMessage:
+        """
+        The final answer, or "Tool execution incomplete".
+        
+        A loop that stops early (max_iterations, time budget, empty reply)
+        ends on a turn whose tool calls were never answered; its content
+        (usually "") is not an answer. Returning the explicit marker lets
+        callers' INCOMPLETE_RESULT_PREFIXES checks catch it instead of
+        reading an empty turn as a clean result.
+        """
+        from langchain_core.messages import AIMessage
+        
+        if self.final_response is not None:
+            return self.final_response
+        return AIMessage(content="Tool execution incomplete")
+
+
 def execute_tool_calls(
     messages: List,
     llm_with_tools,
     tools: Dict[str, Tool],
     max_iterations: int = 3,
     timeout: Optional[float] = 60.0,
-    retry_attempts: int = 2
+    retry_attempts: int = 2,
+    backoff_cap: float = 60.0,
+    history_char_budget: Optional[int] = 24000
 ) -> AIMessage:
     """
     Execute LLM with tool calling loop.
@@ -49,7 +530,11 @@ def execute_tool_calls(
         tools: Dict mapping tool names to Tool objects
         max_iterations: Max tool calls before giving up
         timeout: Max seconds for entire execution
-        retry_attempts: How many times to retry failed LLM calls
+        retry_attempts: How many times to retry transient LLM failures
+            (rate limits, connection errors, timeouts)
+        backoff_cap: Upper bound in seconds for a single backoff sleep
+        history_char_budget: Shrink older tool outputs once the message
+            history exceeds this many characters (None disables)
     
     Returns:
         Final AIMessage from LLM
@@ -66,93 +551,171 @@ def execute_tool_calls(
         )
         print(response.content)  # "The answer is 4"
     """
+    from langchain_core.messages import AIMessage
     
-    tool_iterations = 0
-    final_response = None
-    start_time = time.time()
+    loop = _ToolLoop(messages, llm_with_tools, timeout, retry_attempts, backoff_cap, history_char_budget)
     
-    while tool_iterations < max_iterations:
-        # Check timeout
-        if timeout and (time.time() - start_time) > timeout:
-            logger.warning(f"Timeout after {timeout}s")
+    for _ in range(max_iterations):
+        if loop.expired():
             break
         
-        # Retry LLM call with exponential backoff
-        response = None
-        for attempt in range(retry_attempts + 1):
-            try:
-                response = llm_with_tools.invoke(messages)
-                break
-            except Exception as e:
-                if attempt < retry_attempts:
-                    wait_time = 2 ** attempt
-                    logger.warning(f"Attempt {attempt+1} failed, retrying in {wait_time}s: {e}")
+        response = loop.cached_response()
+        fresh = response is None
+        
+        # Retry transient LLM failures with jittered exponential backoff
+        if fresh:
+            for attempt in range(retry_attempts + 1):
+                wait_time = loop.cooldown_wait()
+                if wait_time is None:
+                    return AIMessage(content=f"Error: {loop.model} is rate limited")
+                if wait_time:
+                    time.sleep(wait_time)
+                
+                try:
+                    response = llm_with_tools.invoke(messages)
+                    break
+                except retryable_errors() as e:
+                    wait_time = loop.retry_wait(e, attempt)
+                    if wait_time is None:
+                        return AIMessage(content=f"Error: {str(e)}")
                     time.sleep(wait_time)
-                else:
-                    logger.error(f"All {retry_attempts+1} attempts failed: {e}")
+                except Exception as e:
+                    logger.error(f"Non-retryable LLM error: {e}")
                     return AIMessage(content=f"Error: {str(e)}")
         
-        if not response or not hasattr(response, "content"):
-            logger.warning("Empty response from LLM")
+        tool_calls = loop.record(response, fresh)
+        if tool_calls is None:
             break
         
-        # Check if LLM wants to call tools
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            messages.append(response)  # Add LLM response
-            
-            # Execute each tool call
-            for tool_call in response.tool_calls:
-                tool_name = tool_call["name"]
+        # Execute all tool calls of this turn concurrently
+        loop.add_tool_results(run_tool_calls(tool_calls, tools))
+    
+    return loop.result()
+
+
+async def execute_tool_calls_async(
+    messages: List,
+    llm_with_tools,
+    tools: Dict[str, Tool],
+    max_iterations: int = 3,
+    timeout: Optional[float] = 60.0,
+    retry_attempts: int = 2,
+    backoff_cap: float = 60.0,
+    history_char_budget: Optional[int] = 24000
+) -> AIMessage:
+    """
+    Async version of execute_tool_calls.
+    
+    Same flow and arguments, but awaits llm_with_tools.ainvoke and dispatches
+    the tool calls of each turn with asyncio.gather. Use this from async
+    nodes so several architects/validators can share one event loop.
+    
+    Unlike the sync loop, a coroutine can be cancelled: each LLM call is cut
+    off when the overall budget runs out (the loop then returns "Tool
+    execution incomplete"), and each tool call is bounded by MAX_TOOL_SECONDS.
+    """
+    from langchain_core.messages import AIMessage
+    
+    loop = _ToolLoop(messages, llm_with_tools, timeout, retry_attempts, backoff_cap, history_char_budget)
+    
+    for _ in range(max_iterations):
+        if loop.expired():
+            break
+        
+        response = loop.cached_response()
+        fresh = response is None
+        budget_exhausted = False
+        
+        # Retry transient LLM failures with jittered exponential backoff
+        if fresh:
+            for attempt in range(retry_attempts + 1):
+                wait_time = loop.cooldown_wait()
+                if wait_time is None:
+                    return AIMessage(content=f"Error: {loop.model} is rate limited")
+                if wait_time:
+                    await asyncio.sleep(wait_time)
                 
-                if tool_name in tools:
-                    try:
-                        # Tool takes 'args' dict and converts to kwargs
-                        tool_args = tool_call.get("args", {})
-                        if not isinstance(tool_args, dict):
-                            tool_args = {"query": str(tool_args)}
-                        
-                        tool_result = tools[tool_name].invoke(tool_args)
-                        
-                        # Add tool result to messages
-                        messages.append(ToolMessage(
-                            content=str(tool_result),
-                            tool_call_id=tool_call["id"]
-                        ))
-                    except Exception as e:
-                        logger.error(f"Tool {tool_name} failed: {e}")
-                        messages.append(ToolMessage(
-                            content=f"Error: {str(e)}",
-                            tool_call_id=tool_call["id"]
-                        ))
-                else:
-                    logger.warning(f"Unknown tool: {tool_name}")
-                    messages.append(ToolMessage(
-                        content=f"Unknown tool: {tool_name}",
-                        tool_call_id=tool_call["id"]
-                    ))
-            
-            tool_iterations += 1
-        else:
-            # LLM didn't call a tool - it's done!
-            final_response = response
+                try:
+                    # Each decode is bounded by what is left of the budget
+                    response = await asyncio.wait_for(
+                        llm_with_tools.ainvoke(messages),
+                        _remaining(loop.deadline) if timeout else None
+                    )
+                    break
+                except retryable_errors() + (asyncio.TimeoutError,) as e:
+                    # On 3.11+ asyncio.TimeoutError IS the builtin TimeoutError a
+                    # transport may raise too: only wait_for firing at the
+                    # deadline means the budget is spent; anything else retries
+                    if isinstance(e, asyncio.TimeoutError) and _remaining(loop.deadline) <= _DEADLINE_SLACK:
+                        logger.warning(f"LLM call cut off by the {timeout}s budget")
+                        budget_exhausted = True
+                        break
+                    wait_time = loop.retry_wait(e, attempt)
+                    if wait_time is None:
+                        return AIMessage(content=f"Error: {str(e)}")
+                    await asyncio.sleep(wait_time)
+                except Exception as e:
+                    logger.error(f"Non-retryable LLM error: {e}")
+                    return AIMessage(content=f"Error: {str(e)}")
+        
+        if budget_exhausted:
+            break  # tool calls still pending: result() reports incomplete
+        
+        tool_calls = loop.record(response, fresh)
+        if tool_calls is None:
             break
+        
+        # Execute all tool calls of this turn concurrently, each bounded
+        # by MAX_TOOL_SECONDS and by what is left of the overall budget
+        tool_timeout = min(MAX_TOOL_SECONDS, _remaining(loop.deadline)) if timeout else MAX_TOOL_SECONDS
+        loop.add_tool_results(await arun_tool_calls(tool_calls, tools, timeout=tool_timeout))
     
-    if final_response is None:
-        # Try to return last response if available
-        for msg in reversed(messages):
-            if isinstance(msg, AIMessage):
-                final_response = msg
-                break
-        if final_response is None:
-            final_response = AIMessage(content="Tool execution incomplete")
-    
-    return final_response
+    return loop.result()
+
+
+# ============================================================================
+# ERROR DETECTION
+# ============================================================================
+# Validators return free text; we need a yes/no "did it find errors?".
+# Keyword scoring is the fallback classifier. Both keyword sets live in ONE
+# precompiled, case-insensitive alternation with named groups, so the text
+# is scanned once (and never lowercased/copied); match.lastgroup says which
+# set a hit belongs to.
+# ============================================================================
+
+# Whole words only ("invalidation", "prefix" and "tissue" are not hits);
+# inflections that count are spelled out, stems end in \w*
+_ERROR_KEYWORDS_RE = re.compile(
+    r"\b(?:(?P<strong>errors?|incorrect|invalid|misconfigur\w*|wrong|needs fix|does not exist"
+    r"|not supported|violat(?:es|ed|ions?)|not recommended|anti[- ]?patterns?)"
+    r"|(?P<weak>problems?|should be|issues?|fix(?:es|ed|ing)?|improve\w*))\b",
+    re.IGNORECASE
+)
+_DETECTION_WINDOW = 1000  # chars kept from the head (70%) and tail (30%)
 
 
 def detect_errors_llm(validation_result: str) -> bool:
     """
-    Use LLM to detect if validation found errors.
-    More reliable than keyword matching.
+    Detect if validation found errors.
+    
+    Verdicts live at the start (summary) and end (conclusion) of a report,
+    so only a head+tail window of long results is scanned.
+    
+    Scoring: two strong indicators ("invalid", "misconfigured", ...) or one
+    strong plus two weak ones ("issue", "should be", ...) count as errors.
+    Stops scanning as soon as the verdict is decided.
     """
-    # (Implementation from previous code - omitted for brevity)
-    pass
\ No newline at end of file
+    if not validation_result:
+        return False
+    
+    text = _smart_truncate(validation_result, _DETECTION_WINDOW)
+    
+    strong_count = weak_count = 0
+    for match in _ERROR_KEYWORDS_RE.finditer(text):
+        if match.lastgroup == "strong":
+            strong_count += 1
+        else:
+            weak_count += 1
+        if strong_count >= 2 or (strong_count >= 1 and weak_count >= 2):
+            return True
+    return False
@@ -4,7 +4,7 @@
 # ============================================================================
 
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Literal
 
 
 # ============================================================================
@@ -57,4 +57,29 @@ class ValidationDecomposition(BaseModel):
     Validation tasks from validator supervisor.
     What should each validator check?
     """
-    validation_tasks: List[ValidationTask]
\ No newline at end of file
+    validation_tasks: List[ValidationTask]
+
+
+class DomainValidation(BaseModel):
+    """Verdict for one domain, as returned by the combined validator."""
+    domain: str = Field(description="Domain name: compute, network, storage, or database")
+    has_errors: bool = Field(description="True if any factual error or misconfiguration was found")
+    validation_result: str = Field(
+        description="Report: valid components, issues found, recommended fixes"
+    )
+    confidence: int = Field(description="Overall confidence in the verdict, 0-100")
+
+
+class ValidationBatch(BaseModel):
+    """
+    All domain verdicts from ONE validator call.
+    One entry per validated domain, plus the cross-domain summary the
+    validation synthesizer would otherwise need a second call for.
+    """
+    validations: List[DomainValidation]
+    overall_status: Literal["PASS", "FAIL"] = Field(
+        description="FAIL if any domain has errors that must be fixed, else PASS"
+    )
+    summary: str = Field(
+        description="Critical issues, non-critical improvements, recommendations for next iteration"
+    )
@@ -3,16 +3,66 @@
 # PURPOSE: Initialize and manage all tools (web search, RAG)
 # ============================================================================
 
-from typing import Dict
-from langchain_core.tools import Tool
-from langchain_openai import ChatOpenAI
-from langchain_community.utilities import GoogleSerperAPIWrapper
-from langchain_chroma import Chroma
-from langchain_ollama.embeddings import OllamaEmbeddings
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List
+from functools import lru_cache
+from core.cache import rag_result_cache, make_key, normalize_query
 import logging
 
+if TYPE_CHECKING:
+    from langchain_core.tools import Tool
+
 logger = logging.getLogger(__name__)
 
+# NOTE: Provider SDKs (langchain_openai, langchain_chroma, langchain_ollama,
+# langchain_community) are imported inside the methods that need them.
+# They are the slowest imports in the project and are not needed until a
+# manager is actually constructed.
+
+
+# ============================================================================
+# SHARED VECTOR STORES
+# ============================================================================
+# Opening a Chroma collection and warming up the embedding model are the
+# expensive parts of ToolManager(). They only depend on the collection, so
+# every ToolManager in the process (notebook re-runs, one system per request)
+# reuses the same store instead of re-opening it.
+# ============================================================================
+
+
+@lru_cache(maxsize=8)
+def _get_vector_store(collection_name: str, persist_directory: str, embedding_model: str):
+    """Open (once per process) a Chroma collection with Ollama embeddings."""
+    import httpx
+    from langchain_chroma import Chroma
+    from langchain_ollama.embeddings import OllamaEmbeddings
+    
+    # Every RAG query embeds its text first. Keep those connections to Ollama
+    # alive (and pooled for the concurrent architects/validators) instead of
+    # reconnecting per query.
+    embeddings = OllamaEmbeddings(
+        model=embedding_model,
+        client_kwargs={
+            "limits": httpx.Limits(
+                max_connections=32, max_keepalive_connections=16, keepalive_expiry=300.0
+            ),
+        },
+    )
+    vector_store = Chroma(
+        collection_name=collection_name,
+        persist_directory=persist_directory,
+        embedding_function=embeddings,
+    )
+    
+    # Pay Ollama's model-load latency now, not on the first real query
+    try:
+        embeddings.embed_query("warmup")
+    except Exception as e:
+        logger.warning(f"Embedding warm-up failed (RAG will retry lazily): {e}")
+    
+    return vector_store
+
 
 class ToolManager:
     """
@@ -21,11 +71,15 @@ class ToolManager:
     """
     
     def __init__(self):
+        self.vector_store = _get_vector_store("AWSDocs", "./chroma_db_AWSDocs", "nomic-embed-text")
         self.web_search_tool = self._init_web_search()
         self.rag_tool = self._init_rag()
     
     def _init_web_search(self) -> Tool:
         """Initialize Google Serper for internet search."""
+        from langchain_core.tools import Tool
+        from langchain_community.utilities import GoogleSerperAPIWrapper
+        
         serper = GoogleSerperAPIWrapper()
         return Tool(
             name="web_search",
@@ -35,26 +89,53 @@ class ToolManager:
     
     def _init_rag(self) -> Tool:
         """Initialize RAG search for vector database."""
-        embeddings = OllamaEmbeddings(model="nomic-embed-text")
-        vector_store = Chroma(
-            collection_name="AWSDocs",
-            persist_directory="./chroma_db_AWSDocs",
-            embedding_function=embeddings,
-        )
+        from langchain_core.tools import Tool
+        
+        vector_store = self.vector_store
+        
+        def format_docs(docs) -> str:
+            if not docs:
+                return "No relevant documentation found."
+            
+            results = []
+            for i, doc in enumerate(docs, 1):
+                content = doc.page_content.strip()[:2000]  # Limit length
+                results.append(f"[Document {i}]:\n{content}\n")
+            
+            return "\n---\n".join(results)
         
         def rag_search(query: str, k: int = 5) -> str:
             """Search AWS documentation vector database."""
             try:
-                docs = vector_store.similarity_search(query, k=k)
-                if not docs:
-                    return "No relevant documentation found."
+                # Same question already answered recently? Skip embedding + search.
+                cache_key = make_key("AWSDocs", normalize_query(query), k)
+                cached = rag_result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
                 
-                results = []
-                for i, doc in enumerate(docs, 1):
-                    content = doc.page_content.strip()[:2000]  # Limit length
-                    results.append(f"[Document {i}]:\n{content}\n")
+                formatted = format_docs(vector_store.similarity_search(query, k=k))
+                rag_result_cache.set(cache_key, formatted)
+                return formatted
+            except Exception as e:
+                logging.error(f"RAG error: {str(e)}")
+                return f"Error: {str(e)}"
+        
+        async def arag_search(query: str, k: int = 5) -> str:
+            """
+            Async version of rag_search.
+            
+            Picked by Tool.ainvoke, so concurrent tool calls (several architects
+            or several queries in one turn) overlap at the vector DB as well.
+            """
+            try:
+                cache_key = make_key("AWSDocs", normalize_query(query), k)
+                cached = rag_result_cache.get(cache_key)
+                if cached is not None:
+                    return cached
                 
-                return "\n---\n".join(results)
+                formatted = format_docs(await vector_store.asimilarity_search(query, k=k))
+                rag_result_cache.set(cache_key, formatted)
+                return formatted
             except Exception as e:
                 logging.error(f"RAG error: {str(e)}")
                 return f"Error: {str(e)}"
@@ -62,9 +143,18 @@ class ToolManager:
         return Tool(
             name="RAG_search",
             func=rag_search,
+            coroutine=arag_search,
             description="Search AWS documentation for accurate architectural guidance"
         )
     
+    def embed_query(self, text: str) -> List[float]:
+        """Embed text with the same model as the RAG store (used by semantic caches)."""
+        return self.vector_store.embeddings.embed_query(text)
+    
+    async def aembed_query(self, text: str) -> List[float]:
+        """Async twin of embed_query (for nodes running on an event loop)."""
+        return await self.vector_store.embeddings.aembed_query(text)
+    
     def get_all_tools(self) -> Dict[str, Tool]:
         """Get all tools as a dictionary."""
         return {
@@ -74,11 +164,44 @@ class ToolManager:
 
 
 class LLMManager:
-    """Manage LLM instances."""
+    """
+    Manage LLM instances.
+    
+    CONNECTION REUSE:
+    Both models share one sync and one async httpx client with keep-alive,
+    so the 8+ LLM calls of an iteration reuse warm TCP/TLS connections
+    instead of each paying a fresh handshake (often 100-300 ms).
+    """
     
     def __init__(self):
-        self.mini_llm = ChatOpenAI(model="gpt-4o-mini")
-        self.reasoning_llm = ChatOpenAI(model="gpt-4o")
+        import httpx
+        from langchain_openai import ChatOpenAI
+        
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        self._http_client = httpx.Client(limits=limits, timeout=120.0)
+        self._http_async_client = httpx.AsyncClient(limits=limits, timeout=120.0)
+        
+        self.mini_llm = ChatOpenAI(
+            model="gpt-4o-mini",
+            http_client=self._http_client,
+            http_async_client=self._http_async_client,
+        )
+        self.reasoning_llm = ChatOpenAI(
+            model="gpt-4o",
+            http_client=self._http_client,
+            http_async_client=self._http_async_client,
+        )
+        self._structured_llms: Dict[type, object] = {}
+        self._bound_llms: Dict[tuple, object] = {}
+    
+    def close(self) -> None:
+        """Close the shared sync HTTP connection pool."""
+        self._http_client.close()
+    
+    async def aclose(self) -> None:
+        """Close both shared HTTP connection pools (call from async code)."""
+        self._http_client.close()
+        await self._http_async_client.aclose()
     
     def get_mini_llm(self):
         """Get fast, cheap LLM for quick tasks."""
@@ -89,9 +212,34 @@ class LLMManager:
         return self.reasoning_llm
     
     def get_mini_with_tools(self, tools: list) -> object:
-        """Bind tools to mini LLM for tool calling."""
-        return self.mini_llm.bind_tools(tools)
+        """
+        Bind tools to mini LLM for tool calling.
+        
+        Cached per tuple of tool names: bind_tools converts every tool to an
+        OpenAI JSON schema, and the architects/validators bind the same one
+        or two tool sets on every call.
+        
+        parallel_tool_calls lets the model request several searches in one
+        turn; execute_tool_calls runs them concurrently and answers them all
+        in a single follow-up, instead of one LLM round-trip per search.
+        """
+        key = tuple(getattr(tool, "name", repr(tool)) for tool in tools)
+        bound = self._bound_llms.get(key)
+        if bound is None:
+            bound = self.mini_llm.bind_tools(tools, parallel_tool_calls=True)
+            self._bound_llms[key] = bound
+        return bound
     
     def get_reasoning_structured(self, schema):
-        """Get reasoning LLM with structured output."""
-        return self.reasoning_llm.with_structured_output(schema)
\ No newline at end of file
+        """
+        Get reasoning LLM with structured output.
+        
+        Cached per schema: with_structured_output converts the Pydantic model
+        to a JSON schema and builds the parser chain every time it is called,
+        while the result only depends on the schema class.
+        """
+        structured = self._structured_llms.get(schema)
+        if structured is None:
+            structured = self.reasoning_llm.with_structured_output(schema)
+            self._structured_llms[schema] = structured
+        return structured
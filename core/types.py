@@ -5,7 +5,6 @@
 
 from typing import TypedDict, Annotated, List, Dict, Any, Optional
 from operator import add
-import hashlib
 
 
 # ============================================================================
@@ -36,13 +35,41 @@ def merge_dicts(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
         result = {"compute": {...}, "network": {...}}  # Both present!
     
     Right takes precedence if same key exists.
+    
+    PERFORMANCE:
+    LangGraph calls this reducer for every parallel architect write, so it
+    avoids recursion and only copies the nested dicts that actually conflict.
+    The common case (disjoint domains: compute vs network) is a single
+    {**left, **right}. Inputs are never mutated.
     """
-    result = left.copy()
-    for key, value in right.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)  # Recursive merge
-        else:
-            result[key] = value
+    # Fast paths: one side empty (e.g. supervisor -> architect steps)
+    if not right:
+        return left
+    if not left:
+        return right.copy()
+    
+    # Fast path: one architect writing its own domain (the parallel-emit case)
+    if len(right) == 1:
+        key, value = next(iter(right.items()))
+        existing = left.get(key)
+        if not (isinstance(existing, dict) and isinstance(value, dict)):
+            return {**left, key: value}
+    
+    result = {**left, **right}
+    if left.keys().isdisjoint(right):
+        return result  # Fast path: nothing to deep-merge
+    
+    # Walk conflicting nested dicts with an explicit stack instead of recursion
+    stack = [(result, left, right)]
+    while stack:
+        target, old, new = stack.pop()
+        for key, value in new.items():
+            if isinstance(value, dict):
+                existing = old.get(key)
+                if isinstance(existing, dict):
+                    merged = {**existing, **value}
+                    target[key] = merged
+                    stack.append((merged, existing, value))
     return result
 
 
@@ -56,6 +83,20 @@ def last_value(left: Any, right: Any) -> Any:
     return right
 
 
+def either(left: bool, right: bool) -> bool:
+    """
+    Sticky-flag reducer: once True, stays True.
+    Used for flags that any node may raise but none should clear by accident.
+    """
+    return left or right
+
+
+# Upper bound on the validation feedback text pasted into one prompt (the
+# architects' refinement context and the validation synthesizer's input);
+# the feedback list itself is unbounded, the prompts built from it are not
+MAX_FEEDBACK_CHARS = 8000
+
+
 def validation_feedback_reducer(left: List[Any], right: List[Any]) -> List[Any]:
     """
     Smart reducer for validation feedback.
@@ -81,24 +122,13 @@ def validation_feedback_reducer(left: List[Any], right: List[Any]) -> List[Any]:
     if not left:
         return right
     
-    # Deduplication by domain
+    # Deduplication by domain: one entry per domain, newer overwrites.
+    # dict keeps first-insertion order, so domains stay in a stable order.
     feedback_dict = {}
-    for item in left:
-        if isinstance(item, dict):
-            domain = item.get('domain', 'unknown')
-            # Use hash to detect duplicate content
-            result = item.get('validation_result', '')
-            result_hash = hashlib.md5(result.encode()).hexdigest()[:8]
-            key = f"{domain}_{result_hash}"
-            feedback_dict[key] = item
-    
-    for item in right:
-        if isinstance(item, dict):
-            domain = item.get('domain', 'unknown')
-            result = item.get('validation_result', '')
-            result_hash = hashlib.md5(result.encode()).hexdigest()[:8]
-            key = f"{domain}_{result_hash}"
-            feedback_dict[key] = item  # Newer overwrites
+    for items in (left, right):
+        for item in items:
+            if isinstance(item, dict):
+                feedback_dict[item.get('domain', 'unknown')] = item
     
     return list(feedback_dict.values())
 
@@ -195,17 +225,23 @@ class ArchitectureState(TypedDict):
     # ========== ERROR TRACKING ==========
     # These determine if we iterate or finish
     
-    factual_errors_exist: Annotated[bool, lambda a, b: b]
-    # Reducer: lambda a, b: b (simple overwrite)
+    factual_errors_exist: Annotated[bool, last_value]
+    # Reducer: last_value (simple overwrite)
     # Why: Validators set this. Last value wins. We reset it each iteration.
     # Example: Validator says "has_errors: True" -> field becomes True
     #          Supervisor resets to False at start of next iteration
     
-    design_flaws_exist: Annotated[bool, lambda a, b: a or b]
-    # Reducer: lambda a, b: a or b (logical OR)
+    design_flaws_exist: Annotated[bool, either]
+    # Reducer: either (logical OR)
     # Why: Once a design flaw is found, it stays True across iterations
     # (Actually not used currently, but kept for future use)
     
+    clean_domains: Annotated[Dict[str, Dict[str, Any]], last_value]
+    # Reducer: last_value (set by the supervisor each iteration)
+    # Why: On an error-fixing iteration, domains that passed validation are
+    # not redesigned or re-validated. Maps domain -> its last passing
+    # feedback entry, which the validators carry over. Empty = redo all.
+    
     
     # ========== FINAL OUTPUT ==========
     
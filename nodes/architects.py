@@ -3,10 +3,19 @@
 # PURPOSE: Domain-specific architect implementations
 # ============================================================================
 
-from typing import cast, Dict, Any, Optional
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from core.types import ArchitectureState
-from core.execution import execute_tool_calls
+from typing import cast, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import lru_cache
+from string import Template
+from langchain_core.messages import SystemMessage, HumanMessage
+from core.types import ArchitectureState, MAX_FEEDBACK_CHARS, merge_dicts
+from core.execution import execute_tool_calls, execute_tool_calls_async, retryable_errors, INCOMPLETE_RESULT_PREFIXES
+from core.cache import ResponseCache, SemanticCache, make_key, tool_call_scope
+from nodes.service_catalog import get_service_sheet
+import asyncio
+import io
+import json
 import logging
 import time
 
@@ -40,7 +49,15 @@ def format_component_recommendations(
     if generated_text and generated_text.strip():
         return generated_text.strip()
     
-    # Fallback to structured format
+    # Fallback to structured format. Retries tend to fail on the same task,
+    # so the rendering is memoized on a canonical JSON form of task_info.
+    return _render_fallback(domain_name, json.dumps(task_info, sort_keys=True, default=str))
+
+
+@lru_cache(maxsize=64)
+def _render_fallback(domain_name: str, task_json: str) -> str:
+    """Markdown stand-in built from the task itself (see format_component_recommendations)."""
+    task_info = json.loads(task_json)
     requirements = task_info.get("requirements", []) or []
     deliverables = task_info.get("deliverables", []) or []
     
@@ -61,6 +78,88 @@ def format_component_recommendations(
     return "\n".join(sections)
 
 
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+# A full architect run is a multi-turn tool loop (seconds to minutes). Retries
+# and loop-backs often send the exact same task + feedback again, so the
+# final recommendations are cached on those inputs.
+# ARCHITECTCACHE_TTL=0 disables it; clear_architect_cache() invalidates it
+# (e.g. after re-embedding the documentation).
+# ============================================================================
+
+_ARCHITECT_CACHE = ResponseCache.from_env("ARCHITECTCACHE", maxsize=256, ttl=3600.0)
+
+# Paraphrase-tolerant layer on top: first-pass designs (no feedback yet) for
+# near-identical problems in the same domain. Refinement passes always go to
+# the LLM - feedback is exactly the detail a similarity match would blur.
+_ARCHITECT_SEMANTIC_CACHE = SemanticCache.from_env("ARCHITECTSEMCACHE", threshold=0.93, maxsize=256)
+
+
+def clear_architect_cache() -> None:
+    """Drop all cached architect recommendations."""
+    _ARCHITECT_CACHE.clear()
+    _ARCHITECT_SEMANTIC_CACHE.clear()
+
+
+# ============================================================================
+# PROMPT LAYOUT (prefix caching)
+# ============================================================================
+# Providers cache prompts by exact prefix bytes (OpenAI does this
+# automatically above ~1k tokens). The architect prompt is therefore split
+# into three system messages, most stable first:
+# 1. Static:    role, expertise, procedure - identical for every call per domain
+# 2. Task:      problem, task, goals, constraints - fixed for one run
+# 3. Iteration: iteration counter and validation feedback - changes every loop
+# Anything volatile placed early would invalidate everything after it.
+# ============================================================================
+
+
+@lru_cache(maxsize=32)
+def _static_architect_prompt(domain: str, domain_services: str) -> str:
+    """
+    Role, service catalog and procedure text for one domain
+    (byte-identical across calls).
+    """
+    service_sheet = get_service_sheet(domain)
+    catalog_section = f"\n**Service Catalog**:{service_sheet}" if service_sheet else ""
+    
+    return f"""
+You are an AWS {domain.capitalize()} Domain Architect.
+Your expertise: {domain_services}
+{catalog_section}
+**What You Should Do**:
+1. Design {domain} infrastructure for the problem
+2. Use web_search for current best practices if needed
+3. Use the Service Catalog above first; call RAG_search only for details
+   it does not cover or to validate against AWS documentation
+4. Provide detailed, production-ready recommendations
+5. Focus ONLY on {domain} - other architects handle other domains
+
+**If Refining**:
+If this is not the first iteration and feedback was provided,
+address the issues that were found. Explain your improvements."""
+
+
+# Parsed once at import; substitute() is a single pass per call.
+_TASK_CONTEXT_TEMPLATE = Template("""
+**Original Problem**: $user_problem
+
+**Your Task**:
+- Description: $task_description
+- Requirements: $requirements
+- Deliverables: $deliverables
+
+**Overall Architecture Goals**: $overall_goals
+**Global Constraints**: $constraints
+""")
+
+_ITERATION_CONTEXT_TEMPLATE = Template("""
+**Iteration**: $iteration/$max_iterations
+$feedback_context
+""")
+
+
 def generic_domain_architect(
     state: ArchitectureState,
     domain: str,
@@ -104,136 +203,310 @@ def generic_domain_architect(
         )
     """
     
-    node_name = f"{domain}_architect"
     logger.info(f"--- {domain.capitalize()} Architect ---")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        # ============ GET TASK FOR THIS DOMAIN ============
-        domain_task = state["architecture_domain_tasks"].get(domain, {})
-        
-        if not domain_task or not domain_task.get("task_description"):
-            error_msg = f"No task assigned for {domain} domain"
-            logger.warning(error_msg)
-            return cast(ArchitectureState, {
-                "architecture_components": {
-                    domain: {
-                        "recommendations": error_msg,
-                        "task_info": {},
-                        "error": "No task"
-                    }
-                }
-            })
+        plan = _plan_architect_call(state, domain, domain_services)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        # ============ GET PREVIOUS VALIDATION FEEDBACK ============
-        # If this is not the first iteration, we want to incorporate feedback
-        validation_feedback = state.get("validation_feedback", [])
-        domain_feedback = [
-            fb for fb in validation_feedback
-            if isinstance(fb, dict) and fb.get("domain", "").lower() == domain.lower()
-        ]
+        if plan["semantic_text"] is not None:
+            try:
+                _semantic_lookup(plan, tool_manager.embed_query(plan["semantic_text"]))
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed for {domain}: {e}")
         
-        feedback_context = ""
-        if domain_feedback:
-            feedback_context = "\n\n**Issues Found in Previous Validation:**\n"
-            for fb in domain_feedback:
-                has_errors = fb.get("has_errors", False)
-                status = "❌ ERRORS" if has_errors else "✓ PASSED"
-                result = fb.get("validation_result", "")[:200]
-                feedback_context += f"{status}: {result}...\n"
+        recommendations = plan["recommendations"]
+        if recommendations is None:
+            # ============ EXECUTE WITH TOOLS ============
+            tools_dict = tool_manager.get_all_tools()
+            llm_with_tools = llm_manager.get_mini_with_tools(list(tools_dict.values()))
+            
+            max_iterations, loop_timeout = _tool_loop_budget(plan, timeout)
+            final_response = execute_tool_calls(
+                plan["messages"],
+                llm_with_tools,
+                tools_dict,
+                max_iterations=max_iterations,
+                timeout=loop_timeout,
+                retry_attempts=2
+            )
+            recommendations = _record_architect_response(plan, domain, final_response)
+        else:
+            logger.info(f"{domain.capitalize()} architect reused cached recommendations")
         
-        # ============ CREATE SYSTEM PROMPT ============
-        # This is domain-specific. Different prompts for compute vs network.
-        overall_goals = state["architecture_domain_tasks"].get("overall_goals", [])
-        constraints = state["architecture_domain_tasks"].get("constraints", [])
+        logger.info("%s architect completed in %.2fs", domain.capitalize(), time.perf_counter() - start_time)
         
-        system_prompt = f"""
-You are an AWS {domain.capitalize()} Domain Architect.
-Your expertise: {domain_services}
-
-**Original Problem**: {state["user_problem"]}
-**Iteration**: {state["iteration_count"]}/{state["max_iterations"]}
-
-**Your Task**:
-- Description: {domain_task.get('task_description', 'Design infrastructure')}
-- Requirements: {', '.join(domain_task.get('requirements', []))}
-- Deliverables: {', '.join(domain_task.get('deliverables', []))}
-
-**Overall Architecture Goals**: {', '.join(overall_goals)}
-**Global Constraints**: {', '.join(constraints)}
+        return _architect_update(domain, recommendations, plan["domain_task"])
+    
+    except Exception as e:
+        return _architect_error_update(domain, e)
 
-{feedback_context}
 
-**What You Should Do**:
-1. Design {domain} infrastructure for the problem
-2. Use web_search for current best practices if needed
-3. Use RAG_search to validate against AWS documentation
-4. Provide detailed, production-ready recommendations
-5. Focus ONLY on {domain} - other architects handle other domains
-
-**If Refining**:
-If this is not the first iteration and feedback was provided,
-address the issues that were found. Explain your improvements.
-        """
-        
-        # ============ PREPARE MESSAGES ============
-        # Messages are local to this function - NOT added to global state
-        # Why? Prevent exponential message growth across iterations
-        local_messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=state["user_problem"])
-        ]
-        
-        # ============ EXECUTE WITH TOOLS ============
-        tools_dict = tool_manager.get_all_tools()
-        llm_with_tools = llm_manager.get_mini_with_tools(list(tools_dict.values()))
-        
-        final_response = execute_tool_calls(
-            local_messages,
-            llm_with_tools,
-            tools_dict,
-            max_iterations=5,
-            timeout=timeout,
-            retry_attempts=2
-        )
-        
-        # ============ VALIDATE RESPONSE ============
-        if not final_response:
-            raise ValueError("No response from LLM")
+async def generic_domain_architect_async(
+    state: ArchitectureState,
+    domain: str,
+    domain_services: str,
+    llm_manager,
+    tool_manager,
+    timeout: float = 120.0
+) -> ArchitectureState:
+    """
+    Async version of generic_domain_architect.
+    
+    Same prompts, caches and state update; the semantic-cache embedding and
+    the tool loop are awaited (aembed_query, execute_tool_calls_async), so
+    several architects can share one event loop (see run_all_architects_async).
+    """
+    logger.info(f"--- {domain.capitalize()} Architect ---")
+    start_time = time.perf_counter()
+    
+    try:
+        plan = _plan_architect_call(state, domain, domain_services)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        content = getattr(final_response, "content", "")
-        if not content or not content.strip():
-            raise ValueError("Empty response from LLM")
+        # Awaited: a blocking embedding round-trip here would serialize the
+        # architects sharing this event loop
+        if plan["semantic_text"] is not None:
+            try:
+                _semantic_lookup(plan, await tool_manager.aembed_query(plan["semantic_text"]))
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed for {domain}: {e}")
         
-        recommendations = format_component_recommendations(domain, domain_task, content)
+        recommendations = plan["recommendations"]
+        if recommendations is None:
+            tools_dict = tool_manager.get_all_tools()
+            llm_with_tools = llm_manager.get_mini_with_tools(list(tools_dict.values()))
+            
+            max_iterations, loop_timeout = _tool_loop_budget(plan, timeout)
+            final_response = await execute_tool_calls_async(
+                plan["messages"],
+                llm_with_tools,
+                tools_dict,
+                max_iterations=max_iterations,
+                timeout=loop_timeout,
+                retry_attempts=2
+            )
+            recommendations = _record_architect_response(plan, domain, final_response)
+        else:
+            logger.info(f"{domain.capitalize()} architect reused cached recommendations")
         
-        duration = time.time() - start_time
-        logger.info(f"{domain.capitalize()} architect completed in {duration:.2f}s")
+        logger.info("%s architect completed in %.2fs", domain.capitalize(), time.perf_counter() - start_time)
         
-        # ============ RETURN UPDATE ============
-        return cast(ArchitectureState, {
-            "architecture_components": {
-                domain: {
-                    "recommendations": recommendations,
-                    "domain": domain,
-                    "task_info": domain_task
-                }
-            }
-        })
+        return _architect_update(domain, recommendations, plan["domain_task"])
     
     except Exception as e:
-        error_msg = f"Error in {domain} architect: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        
-        return cast(ArchitectureState, {
+        return _architect_error_update(domain, e)
+
+
+# ============================================================================
+# ARCHITECT STEPS (shared by the sync and async architects)
+# ============================================================================
+
+def _plan_architect_call(
+    state: ArchitectureState,
+    domain: str,
+    domain_services: str
+) -> Dict[str, Any]:
+    """
+    Everything before the tool loop: task lookup, prompt, exact cache lookup.
+    
+    Returns a plan dict with either:
+    - "early_update": a finished state update (no task for this domain, or
+      a domain that passed validation last iteration), or
+    - "recommendations" (cached text or None), "messages", "domain_task"
+      and the cache handles needed by _record_architect_response.
+      "semantic_text" is the text to embed for a semantic-cache lookup
+      (None when there is nothing to look up); the caller embeds it (sync
+      or async) and hands the vector to _semantic_lookup.
+    """
+    # Passed validation while another domain failed: keep its design as is
+    # (the empty delta leaves architecture_components[domain] untouched)
+    if domain in state.get("clean_domains", {}):
+        logger.info(f"{domain.capitalize()} passed validation last iteration, keeping its design")
+        return {"early_update": cast(ArchitectureState, {"architecture_components": {}})}
+    
+    # Read each state field once
+    domain_tasks = state["architecture_domain_tasks"]
+    user_problem = state["user_problem"]
+    iteration_count = state["iteration_count"]
+    max_iterations = state["max_iterations"]
+    validation_feedback = state.get("validation_feedback", [])
+    
+    # ============ GET TASK FOR THIS DOMAIN ============
+    domain_task = domain_tasks.get(domain, {})
+    
+    if not domain_task or not domain_task.get("task_description"):
+        error_msg = f"No task assigned for {domain} domain"
+        logger.warning(error_msg)
+        return {"early_update": cast(ArchitectureState, {
             "architecture_components": {
                 domain: {
                     "recommendations": error_msg,
-                    "domain": domain,
-                    "error": str(e)
+                    "task_info": {},
+                    "error": "No task"
                 }
             }
-        })
+        })}
+    
+    # ============ GET PREVIOUS VALIDATION FEEDBACK ============
+    # If this is not the first iteration, we want to incorporate feedback
+    # Sorted so the prompt (and its cache key) does not depend on the order
+    # in which parallel validators happened to finish
+    domain_feedback = sorted(
+        (
+            fb for fb in validation_feedback
+            if isinstance(fb, dict) and fb.get("domain", "").lower() == domain.lower()
+        ),
+        key=lambda fb: fb.get("validation_result", "")[:64]
+    )
+    
+    feedback_context = ""
+    if domain_feedback:
+        buffer = io.StringIO()
+        buffer.write("\n\n**Issues Found in Previous Validation:**\n")
+        for fb in domain_feedback:
+            if buffer.tell() >= MAX_FEEDBACK_CHARS:
+                break
+            has_errors = fb.get("has_errors", False)
+            status = "❌ ERRORS" if has_errors else "✓ PASSED"
+            result = fb.get("validation_result", "")[:200]
+            buffer.write(f"{status}: {result}...\n")
+        feedback_context = buffer.getvalue()
+    
+    # ============ CREATE SYSTEM PROMPT ============
+    # Ordered most-stable first (see _static_architect_prompt): role and
+    # procedure, then this run's task, then what changes per iteration.
+    overall_goals = domain_tasks.get("overall_goals", [])
+    constraints = domain_tasks.get("constraints", [])
+    
+    task_context = _TASK_CONTEXT_TEMPLATE.substitute(
+        user_problem=user_problem,
+        task_description=domain_task.get('task_description', 'Design infrastructure'),
+        requirements=', '.join(domain_task.get('requirements', [])),
+        deliverables=', '.join(domain_task.get('deliverables', [])),
+        overall_goals=', '.join(overall_goals),
+        constraints=', '.join(constraints),
+    )
+    
+    iteration_context = _ITERATION_CONTEXT_TEMPLATE.substitute(
+        iteration=iteration_count,
+        max_iterations=max_iterations,
+        feedback_context=feedback_context,
+    )
+    
+    # ============ CHECK RESPONSE CACHE ============
+    # Same domain, task and feedback -> same design. The iteration
+    # counter is left out of the key on purpose.
+    cache_key = make_key("architect", domain, domain_services, task_context, feedback_context)
+    recommendations = _ARCHITECT_CACHE.get(cache_key)
+    
+    # First pass only: look for a near-identical problem in this domain
+    semantic_text = None
+    if recommendations is None and not domain_feedback and _ARCHITECT_SEMANTIC_CACHE.enabled:
+        semantic_text = f"{domain}|{user_problem}"
+    
+    # ============ PREPARE MESSAGES ============
+    # Messages are local to this function - NOT added to global state
+    # Why? Prevent exponential message growth across iterations
+    messages = [
+        SystemMessage(content=_static_architect_prompt(domain, domain_services)),
+        SystemMessage(content=task_context),
+        SystemMessage(content=iteration_context),
+        HumanMessage(content=user_problem)
+    ]
+    
+    return {
+        "recommendations": recommendations,
+        "messages": messages,
+        "domain_task": domain_task,
+        "has_feedback": bool(domain_feedback),
+        "cache_key": cache_key,
+        "semantic_namespace": make_key("architect", domain, domain_services),
+        "semantic_text": semantic_text,
+        "problem_vector": None,
+    }
+
+
+def _semantic_lookup(plan: Dict[str, Any], problem_vector) -> None:
+    """Keep the problem vector (for caching the answer) and take a near-identical earlier design, if any."""
+    plan["problem_vector"] = problem_vector
+    plan["recommendations"] = _ARCHITECT_SEMANTIC_CACHE.get(plan["semantic_namespace"], problem_vector)
+
+
+def _tool_loop_budget(plan: Dict[str, Any], timeout: float) -> Tuple[int, float]:
+    """
+    Tool-loop limits for this call: (max_iterations, timeout).
+    
+    A first pass is a well-scoped task with the service catalog at hand, so
+    it gets 2 rounds and at most 45s. Refinements (feedback to address) keep
+    the full 5 rounds and the caller's timeout.
+    """
+    if plan["has_feedback"]:
+        return 5, timeout
+    return 2, min(timeout, 45.0)
+
+
+def _record_architect_response(plan: Dict[str, Any], domain: str, final_response) -> str:
+    """Validate the LLM's final message, format it and store it in the caches."""
+    # ============ VALIDATE RESPONSE ============
+    if not final_response:
+        raise ValueError("No response from LLM")
+    
+    content = getattr(final_response, "content", "")
+    if not content or not content.strip():
+        raise ValueError("Empty response from LLM")
+    
+    recommendations = format_component_recommendations(domain, plan["domain_task"], content)
+    
+    # Never cache failures: a retry should get a fresh attempt
+    if not content.startswith(INCOMPLETE_RESULT_PREFIXES):
+        _ARCHITECT_CACHE.set(plan["cache_key"], recommendations)
+        if plan["problem_vector"] is not None:
+            _ARCHITECT_SEMANTIC_CACHE.set(
+                plan["semantic_namespace"], plan["problem_vector"], recommendations
+            )
+    
+    return recommendations
+
+
+def _architect_update(domain: str, recommendations: str, domain_task: Dict[str, Any]) -> ArchitectureState:
+    """State update for a successful architect run."""
+    return cast(ArchitectureState, {
+        "architecture_components": {
+            domain: {
+                "recommendations": recommendations,
+                "domain": domain,
+                "task_info": domain_task
+            }
+        }
+    })
+
+
+def _architect_error_update(domain: str, e: BaseException) -> ArchitectureState:
+    """
+    State update for a failed architect run (logged, never raised).
+    
+    Transient provider errors (timeouts, rate limits, dropped connections)
+    log one warning line; only unexpected errors pay for a traceback.
+    """
+    error_msg = f"Error in {domain} architect: {str(e)}"
+    if isinstance(e, retryable_errors()):
+        logger.warning("%s architect transient failure: %s", domain, e)
+    else:
+        logger.error(error_msg, exc_info=e)
+    
+    return cast(ArchitectureState, {
+        "architecture_components": {
+            domain: {
+                "recommendations": error_msg,
+                "domain": domain,
+                "error": str(e)
+            }
+        }
+    })
 
 
 # ============================================================================
@@ -243,6 +516,14 @@ address the issues that were found. Explain your improvements.
 # This approach is DRY - all the logic is in generic_domain_architect.
 # ============================================================================
 
+DOMAIN_SERVICES = {
+    "compute": "EC2, Lambda, ECS, EKS, Auto Scaling, ElastiCache, etc.",
+    "network": "VPC, Subnets, Security Groups, NACLs, ALB, NLB, CloudFront, Route 53, etc.",
+    "storage": "S3, EBS, EFS, Glacier, AWS Backup, Storage Gateway, etc.",
+    "database": "RDS (MySQL, PostgreSQL), DynamoDB, ElastiCache, Aurora, DocumentDB, etc.",
+}
+
+
 def compute_architect(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
     """
     Architect for compute domain: EC2, Lambda, ECS, EKS, Auto Scaling, etc.
@@ -250,7 +531,7 @@ def compute_architect(state: ArchitectureState, llm_manager, tool_manager) -> Ar
     return generic_domain_architect(
         state,
         domain="compute",
-        domain_services="EC2, Lambda, ECS, EKS, Auto Scaling, ElastiCache, etc.",
+        domain_services=DOMAIN_SERVICES["compute"],
         llm_manager=llm_manager,
         tool_manager=tool_manager
     )
@@ -263,7 +544,7 @@ def network_architect(state: ArchitectureState, llm_manager, tool_manager) -> Ar
     return generic_domain_architect(
         state,
         domain="network",
-        domain_services="VPC, Subnets, Security Groups, NACLs, ALB, NLB, CloudFront, Route 53, etc.",
+        domain_services=DOMAIN_SERVICES["network"],
         llm_manager=llm_manager,
         tool_manager=tool_manager
     )
@@ -276,7 +557,7 @@ def storage_architect(state: ArchitectureState, llm_manager, tool_manager) -> Ar
     return generic_domain_architect(
         state,
         domain="storage",
-        domain_services="S3, EBS, EFS, Glacier, AWS Backup, Storage Gateway, etc.",
+        domain_services=DOMAIN_SERVICES["storage"],
         llm_manager=llm_manager,
         tool_manager=tool_manager
     )
@@ -289,7 +570,85 @@ def database_architect(state: ArchitectureState, llm_manager, tool_manager) -> A
     return generic_domain_architect(
         state,
         domain="database",
-        domain_services="RDS (MySQL, PostgreSQL), DynamoDB, ElastiCache, Aurora, DocumentDB, etc.",
+        domain_services=DOMAIN_SERVICES["database"],
         llm_manager=llm_manager,
         tool_manager=tool_manager
-    )
\ No newline at end of file
+    )
+
+
+# ============================================================================
+# ALL ARCHITECTS IN ONE NODE
+# ============================================================================
+# The four architects are independent (disjoint tasks in, disjoint
+# architecture_components keys out) and spend their time waiting on the LLM
+# and tools. Running them as ONE node with a thread pool:
+# - costs the slowest architect instead of the sum of all four
+# - emits a single state update, so the merge_dicts reducer fires once
+# Use this in place of fanning out to the four nodes above.
+# ============================================================================
+
+DOMAIN_ARCHITECTS = {
+    "compute": compute_architect,
+    "network": network_architect,
+    "storage": storage_architect,
+    "database": database_architect,
+}
+
+
+def run_all_architects(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
+    """
+    Run all domain architects concurrently and merge their components.
+    
+    Each architect already catches its own errors and returns an error
+    component, so one failing domain never blocks the others.
+    
+    Identical tool calls across the architects run once (tool_call_scope).
+    """
+    logger.info(f"--- All Architects ({len(DOMAIN_ARCHITECTS)} in parallel) ---")
+    
+    with tool_call_scope(), ThreadPoolExecutor(max_workers=len(DOMAIN_ARCHITECTS)) as pool:
+        futures = [
+            pool.submit(copy_context().run, architect, state, llm_manager, tool_manager)
+            for architect in DOMAIN_ARCHITECTS.values()
+        ]
+        updates = [future.result() for future in futures]
+    
+    components: Dict[str, Any] = {}
+    for update in updates:
+        components = merge_dicts(components, update.get("architecture_components", {}))
+    
+    return cast(ArchitectureState, {
+        "architecture_components": components
+    })
+
+
+async def run_all_architects_async(
+    state: ArchitectureState,
+    llm_manager,
+    tool_manager
+) -> ArchitectureState:
+    """
+    Async version of run_all_architects: one asyncio.gather, no threads.
+    
+    Use it as the node when the graph runs with ainvoke/astream.
+    """
+    logger.info(f"--- All Architects ({len(DOMAIN_SERVICES)} concurrently) ---")
+    
+    with tool_call_scope():
+        results = await asyncio.gather(
+            *(
+                generic_domain_architect_async(state, domain, services, llm_manager, tool_manager)
+                for domain, services in DOMAIN_SERVICES.items()
+            ),
+            return_exceptions=True
+        )
+    
+    components: Dict[str, Any] = {}
+    for domain, result in zip(DOMAIN_SERVICES, results):
+        if isinstance(result, BaseException):
+            result = _architect_error_update(domain, result)
+        components = merge_dicts(components, result.get("architecture_components", {}))
+    
+    return cast(ArchitectureState, {
+        "architecture_components": components
+    })
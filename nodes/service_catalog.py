@@ -0,0 +1,77 @@
+# ============================================================================
+# FILE: nodes/service_catalog.py
+# PURPOSE: Distilled AWS service sheets embedded in the architect prompts
+# ============================================================================
+
+from types import MappingProxyType
+
+
+# ============================================================================
+# WHY A STATIC CATALOG?
+# ============================================================================
+# Most architect tool calls look up the same handful of basics ("what EBS
+# volume types exist?", "Aurora vs RDS?"). Each lookup is a RAG round-trip
+# plus another LLM turn.
+#
+# These sheets answer the common questions up front. They sit in the static
+# (byte-identical) part of the architect prompt, so the provider's prefix
+# cache serves them for free after the first call. RAG_search remains
+# available for anything more specific (limits, quotas, new features).
+#
+# Keep each sheet short and stable: editing one invalidates the cached
+# prefix for that domain.
+# ============================================================================
+
+SERVICE_SHEETS = MappingProxyType({
+    "compute": """
+- EC2: general purpose (t3/t4g burstable, m6i/m7g), compute optimized (c6i/c7g),
+  memory optimized (r6i/r7g), Graviton (g suffix) ~20% better price/performance.
+  Use Auto Scaling groups across >= 2 AZs with target-tracking policies.
+- Lambda: up to 15 min per invocation, 128 MB-10 GB memory (CPU scales with it),
+  pay per request + GB-second; cold starts matter for latency-sensitive paths.
+- ECS (Fargate or EC2 launch type) for containers without Kubernetes;
+  EKS when Kubernetes APIs/tooling are required (control plane billed hourly).
+- Pricing levers: Savings Plans / Reserved Instances for steady load,
+  Spot for fault-tolerant batch work.
+""",
+    "network": """
+- VPC: pick a non-overlapping CIDR (e.g. /16), public + private subnets in
+  each of >= 2 AZs; NAT Gateway per AZ for private egress (billed hourly + per GB).
+- Security Groups are stateful and allow-only; NACLs are stateless, per subnet.
+- ALB: HTTP/HTTPS (layer 7), path/host routing, WAF integration.
+  NLB: TCP/UDP/TLS (layer 4), static IPs, very low latency.
+- CloudFront: CDN with edge caching and TLS termination; origin can be S3, ALB
+  or any HTTP origin. Route 53: DNS with alias records, health checks,
+  latency/weighted/failover routing.
+- Use VPC endpoints (gateway for S3/DynamoDB) to keep traffic off the internet.
+""",
+    "storage": """
+- S3: object storage, 11 nines durability. Classes: Standard, Intelligent-Tiering,
+  Standard-IA, One Zone-IA, Glacier Instant/Flexible Retrieval, Glacier Deep Archive.
+  Use lifecycle rules, versioning, Block Public Access, SSE-S3 or SSE-KMS encryption.
+- EBS: block storage for one EC2 instance in one AZ. gp3 (default SSD, IOPS and
+  throughput set independently), io2 (provisioned IOPS), st1/sc1 (HDD throughput/cold).
+  Snapshots are incremental and stored in S3.
+- EFS: shared NFS file system across AZs; Standard and Infrequent Access classes;
+  elastic throughput for spiky workloads.
+- AWS Backup: central backup policies across EBS, EFS, RDS, DynamoDB, S3.
+""",
+    "database": """
+- RDS: managed MySQL, PostgreSQL, MariaDB, Oracle, SQL Server. Multi-AZ for high
+  availability (synchronous standby), read replicas for read scaling,
+  automated backups with point-in-time recovery.
+- Aurora: MySQL/PostgreSQL compatible, storage replicated 6 ways across 3 AZs,
+  up to 15 low-latency replicas; Aurora Serverless v2 for variable load.
+- DynamoDB: key-value/document, single-digit ms latency; on-demand or provisioned
+  capacity; design around access patterns (partition key, GSIs);
+  global tables for multi-region.
+- ElastiCache (Redis/Valkey, Memcached): in-memory caching and sessions.
+  DocumentDB: MongoDB-compatible document store.
+- Encrypt at rest with KMS, keep databases in private subnets.
+""",
+})
+
+
+def get_service_sheet(domain: str) -> str:
+    """Service sheet for a domain (empty string if none is defined)."""
+    return SERVICE_SHEETS.get(domain, "")
@@ -3,15 +3,57 @@
 # PURPOSE: Architect supervisor node
 # ============================================================================
 
-from typing import cast
-from langchain_core.messages import SystemMessage, AIMessage
+from typing import cast, Dict, Any, List, Optional
+from string import Template
+from langchain_core.messages import SystemMessage
 from core.types import ArchitectureState
 from core.schemas import TaskDecomposition
+from core.cache import ResponseCache, make_key
+from core.execution import is_incomplete_result
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 
+# Decompositions of problems with no validation feedback, keyed on the
+# problem text alone. A loop-back without feedback (e.g. min_iterations not
+# reached yet) would otherwise pay a full reasoning-model call for the same
+# answer. Feedback changes the prompt, so those runs always go to the LLM.
+_SUPERVISOR_CACHE = ResponseCache.from_env("SUPERVISORCACHE", maxsize=256, ttl=3600.0)
+
+
+_MAX_BACKOFF = 8.0  # seconds; caps 2**attempt between supervisor retries
+
+
+# Static part of the supervisor prompt, sent first so it stays a
+# byte-identical (provider-cacheable) prefix across problems and iterations.
+_SUPERVISOR_STATIC_PROMPT = """
+You are an AWS architect supervisor.
+Break down the user's problem into tasks for different domain architects.
+
+Create detailed tasks for these domains:
+1. Compute (EC2, Lambda, ECS, EKS)
+2. Network (VPC, ALB, Route 53, CloudFront)
+3. Storage (S3, EBS, EFS)
+4. Database (RDS, DynamoDB, ElastiCache)
+
+For each domain, provide:
+- Clear task description
+- Key requirements
+- Expected deliverables
+- Constraints
+
+If this is a refinement iteration, address the issues found."""
+
+# Parsed once at import; only the problem, iteration and feedback vary.
+_SUPERVISOR_CONTEXT_TEMPLATE = Template("""
+User Problem: $user_problem
+Iteration: $iteration/$max_iterations
+$feedback_context""")
+
+
 def architect_supervisor(
     state: ArchitectureState,
     llm_manager,
@@ -42,38 +84,9 @@ def architect_supervisor(
     logger.info(f"Architect Supervisor (Iteration {iteration}/{state['max_iterations']})")
     
     try:
-        # Get feedback from previous iteration
-        previous_feedback = state.get("validation_feedback", [])
-        feedback_context = ""
-        if previous_feedback:
-            feedback_context = "\n\nIssues found in previous iteration:\n"
-            for fb in previous_feedback:
-                domain = fb.get("domain", "?")
-                feedback_context += f"- {domain}: {fb.get('validation_result', '')[:100]}...\n"
-        
-        system_prompt = f"""
-You are an AWS architect supervisor.
-Break down the user's problem into tasks for different domain architects.
-
-User Problem: {state['user_problem']}
-Iteration: {iteration}/{state['max_iterations']}
-
-{feedback_context}
-
-Create detailed tasks for these domains:
-1. Compute (EC2, Lambda, ECS, EKS)
-2. Network (VPC, ALB, Route 53, CloudFront)
-3. Storage (S3, EBS, EFS)
-4. Database (RDS, DynamoDB, ElastiCache)
-
-For each domain, provide:
-- Clear task description
-- Key requirements
-- Expected deliverables
-- Constraints
-
-If this is a refinement iteration, address the issues found.
-        """
+        plan = _plan_supervisor_call(state, iteration)
+        if "early_update" in plan:
+            return plan["early_update"]
         
         # Get LLM with structured output
         structured_llm = llm_manager.get_reasoning_structured(TaskDecomposition)
@@ -82,49 +95,211 @@ If this is a refinement iteration, address the issues found.
         task_decomposition = None
         for attempt in range(max_retries):
             try:
-                messages = [SystemMessage(content=system_prompt)]
-                response = structured_llm.invoke(messages)
+                response = structured_llm.invoke(plan["messages"])
                 task_decomposition = cast(TaskDecomposition, response)
                 
                 if task_decomposition and task_decomposition.decomposed_tasks:
                     break
+                logger.warning(f"Attempt {attempt+1} returned no tasks")
             except Exception as e:
                 if attempt < max_retries - 1:
                     logger.warning(f"Attempt {attempt+1} failed, retrying: {e}")
-                    time.sleep(2 ** attempt)
+                    time.sleep(min(2 ** attempt, _MAX_BACKOFF))
                 else:
                     raise
         
-        if not task_decomposition:
-            raise ValueError("Could not generate task decomposition")
-        
-        # Format for state
-        domain_tasks_update = {
-            "overall_goals": task_decomposition.overall_architecture_goals,
-            "constraints": task_decomposition.constraints,
-        }
+        return _supervisor_update(plan, task_decomposition)
+    
+    except Exception as e:
+        return _supervisor_error_update(iteration, e)
+
+
+async def architect_supervisor_async(
+    state: ArchitectureState,
+    llm_manager,
+    max_retries: int = 3
+) -> ArchitectureState:
+    """
+    Async version of architect_supervisor.
+    
+    Same prompt, cache and state update; awaits structured_llm.ainvoke and
+    backs off with asyncio.sleep, so a retry never blocks the event loop
+    that the async architects/validators share.
+    """
+    iteration = state["iteration_count"] + 1
+    logger.info(f"Architect Supervisor (Iteration {iteration}/{state['max_iterations']})")
+    
+    try:
+        plan = _plan_supervisor_call(state, iteration)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        for task in task_decomposition.decomposed_tasks:
-            domain_key = task.domain.lower()
-            domain_tasks_update[domain_key] = {
-                "task_description": task.task_description,
-                "requirements": task.requirements,
-                "deliverables": task.deliverables
-            }
+        structured_llm = llm_manager.get_reasoning_structured(TaskDecomposition)
         
-        logger.info("Supervisor completed successfully")
+        task_decomposition = None
+        for attempt in range(max_retries):
+            try:
+                response = await structured_llm.ainvoke(plan["messages"])
+                task_decomposition = cast(TaskDecomposition, response)
+                
+                if task_decomposition and task_decomposition.decomposed_tasks:
+                    break
+                logger.warning(f"Attempt {attempt+1} returned no tasks")
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    logger.warning(f"Attempt {attempt+1} failed, retrying: {e}")
+                    await asyncio.sleep(min(2 ** attempt, _MAX_BACKOFF))
+                else:
+                    raise
         
-        return cast(ArchitectureState, {
-            "architecture_domain_tasks": domain_tasks_update,
-            "iteration_count": iteration,
-            "validation_feedback": [],  # Reset for new iteration
-            "architecture_components": {},  # Clear old components
-            "factual_errors_exist": False,  # Reset error flag
-        })
+        return _supervisor_update(plan, task_decomposition)
     
     except Exception as e:
-        logger.error(f"Supervisor error: {e}", exc_info=True)
-        return cast(ArchitectureState, {
+        return _supervisor_error_update(iteration, e)
+
+
+# ============================================================================
+# SUPERVISOR STEPS (shared by the sync and async supervisors)
+# ============================================================================
+
+def _plan_supervisor_call(state: ArchitectureState, iteration: int) -> Dict[str, Any]:
+    """
+    Everything before the LLM call: cache lookup and prompt.
+    
+    Returns a plan dict with either:
+    - "early_update": a finished state update (cached or still-valid
+      decomposition), or
+    - "messages", "cache_key" (None when there is feedback) and "iteration".
+    """
+    # Get feedback from previous iteration
+    previous_feedback = state.get("validation_feedback", [])
+    
+    # No feedback: the decomposition only depends on the problem text
+    cache_key = None
+    if not previous_feedback:
+        cache_key = make_key("architect_supervisor", state["user_problem"])
+        cached_tasks = _SUPERVISOR_CACHE.get(cache_key)
+        if cached_tasks is not None:
+            logger.info("Supervisor reused cached task decomposition")
+            return {"early_update": cast(ArchitectureState, {
+                "architecture_domain_tasks": dict(cached_tasks),
+                "iteration_count": iteration,
+                "validation_feedback": [],
+                "architecture_components": {},
+                "factual_errors_exist": False,
+                "clean_domains": {},
+            })}
+    
+    # Every domain passed: the current tasks are still right, only the
+    # iteration moves on (e.g. a min_iterations refinement pass)
+    prior_tasks = state.get("architecture_domain_tasks", {})
+    if (
+        previous_feedback
+        and not any(fb.get("has_errors", False) for fb in previous_feedback)
+        and any(domain in prior_tasks for domain in ("compute", "network", "storage", "database"))
+    ):
+        logger.info("No validation errors, keeping the current task decomposition")
+        return {"early_update": cast(ArchitectureState, {
+            "architecture_domain_tasks": {},  # empty delta: tasks unchanged
             "iteration_count": iteration,
-            "factual_errors_exist": True,  # Mark as error
-        })
\ No newline at end of file
+            "validation_feedback": [],
+            "architecture_components": {},
+            "factual_errors_exist": False,
+            "clean_domains": {},
+        })}
+    
+    feedback_context = ""
+    if previous_feedback:
+        feedback_context = "\n\nIssues found in previous iteration:\n" + "".join(
+            f"- {fb.get('domain', '?')}: {fb.get('validation_result', '')[:100]}...\n"
+            for fb in sorted(previous_feedback, key=lambda fb: fb.get("domain", "?"))
+        )
+    
+    context_prompt = _SUPERVISOR_CONTEXT_TEMPLATE.substitute(
+        user_problem=state["user_problem"],
+        iteration=iteration,
+        max_iterations=state["max_iterations"],
+        feedback_context=feedback_context,
+    )
+    
+    return {
+        "messages": [
+            SystemMessage(content=_SUPERVISOR_STATIC_PROMPT),
+            SystemMessage(content=context_prompt)
+        ],
+        "cache_key": cache_key,
+        "iteration": iteration,
+        "clean_domains": _clean_domains(previous_feedback, state.get("architecture_components", {})),
+    }
+
+
+def _clean_domains(
+    previous_feedback: List[Dict[str, Any]],
+    components: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Domains that can sit out an error-fixing iteration.
+    
+    Only when some domain failed validation: a domain that passed (and has
+    a design to keep) is neither redesigned nor re-validated. Without any
+    failure (e.g. a min_iterations refinement pass) every domain reruns.
+    A validator run that itself failed (rate limit, timeout, incomplete
+    tool loop, empty verdict - see is_incomplete_result) never counts as a
+    pass.
+    """
+    if not any(fb.get("has_errors", False) for fb in previous_feedback):
+        return {}
+    return {
+        fb["domain"]: fb
+        for fb in previous_feedback
+        if not fb.get("has_errors", False)
+        and fb.get("status") != "skipped"
+        and not is_incomplete_result(fb.get("validation_result", ""))
+        and fb.get("domain") in components
+    }
+
+
+def _supervisor_update(
+    plan: Dict[str, Any],
+    task_decomposition: Optional[TaskDecomposition]
+) -> ArchitectureState:
+    """Format the decomposition for state (and cache it when cacheable)."""
+    if not task_decomposition or not task_decomposition.decomposed_tasks:
+        raise ValueError("Could not generate task decomposition")
+    
+    # Format for state
+    domain_tasks_update = {
+        "overall_goals": task_decomposition.overall_architecture_goals,
+        "constraints": task_decomposition.constraints,
+    }
+    
+    for task in task_decomposition.decomposed_tasks:
+        domain_key = task.domain.lower()
+        domain_tasks_update[domain_key] = {
+            "task_description": task.task_description,
+            "requirements": task.requirements,
+            "deliverables": task.deliverables
+        }
+    
+    if plan["cache_key"] is not None:
+        _SUPERVISOR_CACHE.set(plan["cache_key"], dict(domain_tasks_update))
+    
+    logger.info("Supervisor completed successfully")
+    
+    return cast(ArchitectureState, {
+        "architecture_domain_tasks": domain_tasks_update,
+        "iteration_count": plan["iteration"],
+        "validation_feedback": [],  # Reset for new iteration
+        "architecture_components": {},  # Clear old components
+        "factual_errors_exist": False,  # Reset error flag
+        "clean_domains": plan["clean_domains"],
+    })
+
+
+def _supervisor_error_update(iteration: int, e: BaseException) -> ArchitectureState:
+    """State update for a failed supervisor run (logged, never raised)."""
+    logger.error(f"Supervisor error: {e}", exc_info=True)
+    return cast(ArchitectureState, {
+        "iteration_count": iteration,
+        "factual_errors_exist": True,  # Mark as error
+    })
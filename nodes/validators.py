@@ -3,16 +3,47 @@
 # PURPOSE: Validate architecture against AWS documentation
 # ============================================================================
 
-from typing import cast, Dict, Any, Optional
+from typing import cast, Callable, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
 from langchain_core.messages import SystemMessage, HumanMessage
-from core.types import ArchitectureState
-from core.execution import execute_tool_calls, detect_errors_llm
-from core.schemas import ValidationTask, ValidationDecomposition
+from core.types import ArchitectureState, MAX_FEEDBACK_CHARS
+from core.execution import (
+    execute_tool_calls, execute_tool_calls_async, arun_tool_calls, detect_errors_llm, retryable_errors,
+    MAX_TOOL_SECONDS, is_incomplete_result
+)
+from core.schemas import ValidationTask, ValidationDecomposition, ValidationBatch, DomainValidation
+from core.cache import ResponseCache, make_key, tool_call_scope
+import asyncio
+import io
+import json
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+# Outputs of the two reasoning-model nodes that only summarize/plan
+# (validator_supervisor, validation_synthesizer), keyed on node name plus
+# their exact input. Re-validating an unchanged architecture - common when
+# an iteration loop converges - reuses the earlier answer.
+_NODE_CACHE = ResponseCache.from_env("VALIDATIONCACHE", maxsize=512, ttl=3600.0)
+
+# Per-domain validator verdicts, keyed on the full validator prompt (which
+# embeds the recommendations under review). An unchanged domain is not
+# re-validated with a fresh RAG tool loop.
+_VALIDATOR_CACHE = ResponseCache.from_env("VALIDATORCACHE", maxsize=256, ttl=3600.0)
+
+# Per-excerpt budget for documentation pre-fetched into the validator prompt
+_PREFETCH_EXCERPT_CHARS = 500
+
+
+def clear_validator_cache() -> None:
+    """Drop all cached validator verdicts."""
+    _VALIDATOR_CACHE.clear()
+
 
 # ============================================================================
 # VALIDATION STRATEGY
@@ -37,6 +68,48 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
+# Per-domain budget for recommendations shown to the validator supervisor
+# (it only picks what to validate; the validators see the full text)
+_SUPERVISOR_RECOMMENDATION_CHARS = 2000
+
+
+def _compact_components(components: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Compact JSON of what the validator supervisor needs per domain.
+    
+    Only the task, a bounded head of the recommendations and any error are
+    kept (task_info requirements/deliverables and other fields are dropped).
+    Compact separators instead of dict repr mean fewer prompt tokens, and
+    sort_keys makes the prompt independent of the order in which the
+    parallel architects finished.
+    """
+    compact = {}
+    for domain, info in components.items():
+        if not isinstance(info, dict):
+            continue
+        entry = {
+            "task": info.get("task_info", {}).get("task_description", ""),
+            "recommendations": str(info.get("recommendations", ""))[:_SUPERVISOR_RECOMMENDATION_CHARS],
+        }
+        if info.get("error"):
+            entry["error"] = info["error"]
+        compact[domain] = entry
+    return json.dumps(compact, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+# Static part of the validator supervisor prompt (sent first, byte-identical)
+_VALIDATOR_SUPERVISOR_PROMPT = """
+You are a validation supervisor for AWS architecture.
+You will break down the architecture into validation tasks.
+
+For each domain with components (compute, network, storage, database):
+1. List specific AWS services to validate
+2. Specify validation focus (config, best practices, compatibility)
+3. Explain what to check
+
+Output as JSON matching ValidationDecomposition schema."""
+
+
 def validator_supervisor(
     state: ArchitectureState,
     llm_manager
@@ -65,41 +138,42 @@ def validator_supervisor(
     logger.info("--- Validator Supervisor ---")
     
     try:
-        architecture_components = state.get("architecture_components", {})
+        architecture_components = _compact_components(state.get("architecture_components", {}))
         proposed_architecture = state.get("proposed_architecture", {})
         
-        system_prompt = f"""
-You are a validation supervisor for AWS architecture.
-You will break down the architecture into validation tasks.
-
+        # Static instructions first (cacheable prefix), architecture last
+        architecture_prompt = f"""
 **Architecture Components**:
 {architecture_components}
 
 **Proposed Architecture**:
-{proposed_architecture.get('architecture_summary', 'N/A')[:5000]}...
-
-For each domain with components (compute, network, storage, database):
-1. List specific AWS services to validate
-2. Specify validation focus (config, best practices, compatibility)
-3. Explain what to check
-
-Output as JSON matching ValidationDecomposition schema.
-        """
+{proposed_architecture.get('architecture_summary', 'N/A')[:5000]}..."""
         
-        try:
-            # Get structured LLM
-            structured_llm = llm_manager.get_reasoning_structured(ValidationDecomposition)
-            messages = [SystemMessage(content=system_prompt)]
-            
-            response = structured_llm.invoke(messages)
-            validation_decomposition = cast(ValidationDecomposition, response)
-            
-            if not validation_decomposition or not validation_decomposition.validation_tasks:
-                raise ValueError("Empty validation decomposition")
+        cache_key = make_key("validator_supervisor", _VALIDATOR_SUPERVISOR_PROMPT, architecture_prompt)
+        validation_decomposition = _NODE_CACHE.get(cache_key)
         
-        except Exception as e:
-            logger.warning(f"Structured output failed, returning empty tasks: {e}")
-            validation_decomposition = ValidationDecomposition(validation_tasks=[])
+        if validation_decomposition is None:
+            try:
+                # Get structured LLM
+                structured_llm = llm_manager.get_reasoning_structured(ValidationDecomposition)
+                messages = [
+                    SystemMessage(content=_VALIDATOR_SUPERVISOR_PROMPT),
+                    SystemMessage(content=architecture_prompt)
+                ]
+                
+                response = structured_llm.invoke(messages)
+                validation_decomposition = cast(ValidationDecomposition, response)
+                
+                if not validation_decomposition or not validation_decomposition.validation_tasks:
+                    raise ValueError("Empty validation decomposition")
+                
+                _NODE_CACHE.set(cache_key, validation_decomposition)
+            
+            except Exception as e:
+                logger.warning(f"Structured output failed, returning empty tasks: {e}")
+                validation_decomposition = ValidationDecomposition(validation_tasks=[])
+        else:
+            logger.info("Validator supervisor reused cached decomposition")
         
         # ============ FORMAT FOR STATE ============
         validation_tasks_update = {}
@@ -110,24 +184,133 @@ Output as JSON matching ValidationDecomposition schema.
                 "validation_focus": task.validation_focus
             }
         
-        # Merge with existing domain tasks
-        from core.types import merge_dicts
-        existing_tasks = state.get("architecture_domain_tasks", {})
-        merged = merge_dicts(existing_tasks, {"validation_tasks": validation_tasks_update})
-        
         logger.info(f"Created {len(validation_tasks_update)} validation tasks")
         
+        # Return only the delta: the merge_dicts reducer on
+        # architecture_domain_tasks folds it into the existing tasks
         return cast(ArchitectureState, {
-            "architecture_domain_tasks": merged
+            "architecture_domain_tasks": {"validation_tasks": validation_tasks_update}
         })
     
     except Exception as e:
         logger.error(f"Validator supervisor error: {e}", exc_info=True)
         return cast(ArchitectureState, {
-            "architecture_domain_tasks": state.get("architecture_domain_tasks", {})
+            "architecture_domain_tasks": {}  # nothing to merge
         })
 
 
+# ============================================================================
+# VALIDATOR PROMPT LAYOUT (static first, dynamic last)
+# ============================================================================
+# Providers cache prompt PREFIXES. Role, checklist, procedure and report
+# format only change with the domain, so they form the first message and
+# stay byte-identical across calls and iterations; the task and the
+# recommendations under review follow in their own message.
+# ============================================================================
+
+# Parsed once at import; substitute() is a single pass per call.
+_VALIDATOR_STATIC_TEMPLATE = Template("""
+You are a $domain_cap Domain Validator for AWS.
+Validate the architecture against AWS documentation.
+
+**What to Check**:
+$focus_description
+
+**How to Validate**:
+1. Use RAG_search to find AWS documentation for each service
+   (request all the searches you need in the same turn)
+2. Check if the recommendations match the docs
+3. Flag any errors, misconfigurations, or missing best practices
+4. Rate your confidence level
+
+**Report Format**:
+Reply with ONLY a JSON object (no markdown fences) with these fields:
+- "domain": "$domain"
+- "has_errors": true if any error or misconfiguration was found, else false
+- "validation_result": concise report - valid components, issues, recommended fixes
+- "confidence": overall confidence, 0-100
+""")
+
+_VALIDATOR_TASK_TEMPLATE = Template("""
+**Components to Validate**: $components
+**Validation Focus**: $validation_focus
+
+**Proposed $domain_cap Architecture**:
+$recommendations
+""")
+
+
+@lru_cache(maxsize=32)
+def _static_validator_prompt(domain: str, focus_description: str) -> str:
+    """Role, checklist, procedure and report format (byte-identical across calls)."""
+    return _VALIDATOR_STATIC_TEMPLATE.substitute(
+        domain=domain,
+        domain_cap=domain.capitalize(),
+        focus_description=focus_description,
+    )
+
+
+@lru_cache(maxsize=32)
+def _domain_template(template: Template, domain: str, focus_description: str) -> Template:
+    """
+    template with the per-domain static fields (domain name, checklist)
+    already filled in.
+    
+    Those fields only change with the domain, so each combined-validator
+    section substitutes just the task-specific parts. "$" in the checklist is
+    escaped so the second substitute() leaves it alone.
+    """
+    return Template(template.safe_substitute(
+        domain=domain,
+        domain_cap=domain.capitalize(),
+        focus_description=focus_description.replace("$", "$$"),
+    ))
+
+
+def _read_verdict(text: str) -> Tuple[str, bool, Optional[int]]:
+    """
+    Turn the validator's final message into (report, has_errors, confidence).
+    
+    The prompt asks for a DomainValidation JSON object, so has_errors comes
+    straight from the model. If the reply is not valid JSON (prose, a
+    truncated object, an error message), the raw text is kept and
+    detect_errors_llm decides, as before.
+    """
+    start, end = text.find("{"), text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            verdict = DomainValidation.model_validate_json(text[start:end + 1])
+            return verdict.validation_result, verdict.has_errors, verdict.confidence
+        except ValueError:
+            pass  # pydantic.ValidationError is a ValueError
+    return text, detect_errors_llm(text), None
+
+
+def _skipped_feedback(domain: str) -> Dict[str, Any]:
+    """Feedback entry for a domain that has no validation task."""
+    return {
+        "domain": domain,
+        "status": "skipped",
+        "validation_result": f"No validation tasks for {domain}",
+        "components_validated": [],
+        "has_errors": False
+    }
+
+
+def _log_validator_failure(domain: str, error_msg: str, e: BaseException) -> None:
+    """
+    Log a validator failure.
+    
+    Transient provider errors (timeouts, rate limits, dropped connections)
+    are expected under load: one warning line, no traceback. Anything else
+    is a bug or misconfiguration and gets the full traceback.
+    """
+    if isinstance(e, retryable_errors()):
+        logger.warning("%s validator transient failure: %s", domain, e)
+    else:
+        logger.error(error_msg, exc_info=e)
+
+
 def generic_domain_validator(
     state: ArchitectureState,
     domain: str,
@@ -158,172 +341,719 @@ def generic_domain_validator(
         Updated state with validation_feedback
     """
     
-    node_name = f"{domain}_validator"
     logger.info(f"--- {domain.capitalize()} Validator ---")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
-        # ============ GET VALIDATION TASK ============
-        validation_tasks = state.get("architecture_domain_tasks", {}).get("validation_tasks", {})
-        domain_validation = validation_tasks.get(domain, {})
+        plan = _plan_validator_call(state, domain, validation_focus_description)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        if not domain_validation:
-            logger.info(f"No validation task for {domain}, skipping")
-            return cast(ArchitectureState, {
-                "validation_feedback": [{
-                    "domain": domain,
-                    "status": "skipped",
-                    "validation_result": f"No validation tasks for {domain}",
-                    "components_validated": [],
-                    "has_errors": False
-                }]
-            })
+        verdict = plan["cached"]
+        if verdict is None:
+            # ============ EXECUTE WITH TOOLS ============
+            rag_tools = _rag_tools(tool_manager)
+            llm_with_tools = llm_manager.get_mini_with_tools(list(rag_tools.values()))
+            
+            final_response = execute_tool_calls(
+                plan["messages"],
+                llm_with_tools,
+                rag_tools,
+                timeout=timeout
+            )
+            verdict = _record_validator_response(plan, final_response)
+        else:
+            logger.info(f"{domain.capitalize()} validator reused cached verdict")
         
-        # ============ GET RECOMMENDATIONS TO VALIDATE ============
-        components = state.get("architecture_components", {})
-        domain_components = components.get(domain, {})
-        recommendations = domain_components.get('recommendations', '')
+        logger.info(
+            "%s validator completed in %.2fs (errors: %s)",
+            domain.capitalize(), time.perf_counter() - start_time, verdict[1]
+        )
+        return _validator_update(domain, plan, verdict)
+    
+    except Exception as e:
+        return _validator_error_update(domain, e)
+
+
+async def generic_domain_validator_async(
+    state: ArchitectureState,
+    domain: str,
+    validation_focus_description: str,
+    llm_manager,
+    tool_manager,
+    timeout: float = 300.0,
+    prefetch: bool = False
+) -> ArchitectureState:
+    """
+    Async version of generic_domain_validator.
+    
+    Same prompt, cache and feedback entry; the RAG tool loop awaits
+    execute_tool_calls_async (see run_all_validators_async).
+    
+    PREFETCH MODE (prefetch=True):
+    Instead of letting the model search one service per turn, run one
+    RAG_search per component to validate up front (concurrently), paste the
+    excerpts into the prompt and make a single plain LLM call - no tools
+    bound, no tool loop.
+    """
+    logger.info(f"--- {domain.capitalize()} Validator ---")
+    start_time = time.perf_counter()
+    
+    try:
+        plan = _plan_validator_call(state, domain, validation_focus_description)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        # ============ CREATE VALIDATION PROMPT ============
-        components_to_validate = domain_validation.get("components_to_validate", [])
-        validation_focus = domain_validation.get("validation_focus", "general validation")
+        verdict = plan["cached"]
+        if verdict is None and prefetch:
+            deadline = time.monotonic() + timeout
+            docs = await _prefetch_docs(domain, plan["components_to_validate"], tool_manager, timeout)
+            *prompt_messages, human_message = plan["messages"]
+            messages = [*prompt_messages, SystemMessage(content=docs), human_message]
+            
+            final_response = await execute_tool_calls_async(
+                messages,
+                llm_manager.get_mini_llm(),
+                {},
+                timeout=max(1.0, deadline - time.monotonic())
+            )
+            verdict = _record_validator_response(plan, final_response)
+        elif verdict is None:
+            rag_tools = _rag_tools(tool_manager)
+            llm_with_tools = llm_manager.get_mini_with_tools(list(rag_tools.values()))
+            
+            final_response = await execute_tool_calls_async(
+                plan["messages"],
+                llm_with_tools,
+                rag_tools,
+                timeout=timeout
+            )
+            verdict = _record_validator_response(plan, final_response)
+        else:
+            logger.info(f"{domain.capitalize()} validator reused cached verdict")
         
-        system_prompt = f"""
-You are a {domain.capitalize()} Domain Validator for AWS.
-Validate the architecture against AWS documentation.
+        logger.info(
+            "%s validator completed in %.2fs (errors: %s)",
+            domain.capitalize(), time.perf_counter() - start_time, verdict[1]
+        )
+        return _validator_update(domain, plan, verdict)
+    
+    except Exception as e:
+        return _validator_error_update(domain, e)
 
-**Components to Validate**: {', '.join(components_to_validate)}
-**Validation Focus**: {validation_focus}
-**What to Check**:
-{validation_focus_description}
 
-**Proposed {domain.capitalize()} Architecture**:
-{recommendations}
+# ============================================================================
+# VALIDATOR STEPS (shared by the sync and async validators)
+# ============================================================================
 
-**How to Validate**:
-1. Use RAG_search to find AWS documentation for each service
-2. Check if the recommendations match the docs
-3. Flag any errors, misconfigurations, or missing best practices
-4. Rate your confidence level
+def _rag_tools(tool_manager) -> Dict[str, Any]:
+    """Validators only get RAG_search: they check against the docs, not the web."""
+    return {k: v for k, v in tool_manager.get_all_tools().items() if k == "RAG_search"}
 
-**Report Format**:
-- List valid components (correctly configured)
-- List issues (errors, gaps, improvements)
-- Recommendations for fixes
-- Overall confidence (0-100%)
-        """
-        
-        local_messages = [
-            SystemMessage(content=system_prompt),
+
+async def _prefetch_docs(
+    domain: str,
+    components: list,
+    tool_manager,
+    timeout: float
+) -> str:
+    """
+    Run one RAG_search per component concurrently; return a prompt section.
+    
+    Goes through arun_tool_calls, so searches already made in this request
+    scope are reused and a failing or slow search becomes an "Error: ..."
+    excerpt instead of failing the validator.
+    
+    The searches run concurrently, each bounded by MAX_TOOL_SECONDS and by
+    half of `timeout` (the validator's whole budget): the LLM call that
+    follows always keeps at least the other half.
+    """
+    queries = [f"AWS {component}" for component in components] or [f"AWS {domain} best practices"]
+    tool_calls = [
+        {"name": "RAG_search", "args": {"query": query}, "id": f"prefetch-{domain}-{i}"}
+        for i, query in enumerate(queries)
+    ]
+    search_timeout = min(MAX_TOOL_SECONDS, timeout / 2)
+    results = await arun_tool_calls(tool_calls, _rag_tools(tool_manager), timeout=search_timeout)
+    
+    buf = io.StringIO()
+    buf.write("\n**AWS Documentation (already retrieved - no tools are available, use these excerpts)**:\n")
+    for query, message in zip(queries, results):
+        buf.write(f"\n[{query}]\n{str(message.content)[:_PREFETCH_EXCERPT_CHARS]}\n")
+    return buf.getvalue()
+
+
+def _plan_validator_call(
+    state: ArchitectureState,
+    domain: str,
+    validation_focus_description: str
+) -> Dict[str, Any]:
+    """
+    Everything before the tool loop: task lookup, prompt, cache lookup.
+    
+    Returns a plan dict with either:
+    - "early_update": a finished state update (no task for this domain), or
+    - "cached" (a cached verdict or None), "messages", "cache_key" and
+      "components_to_validate".
+    """
+    # Design unchanged since it passed (see clean_domains): carry the verdict
+    carried = state.get("clean_domains", {}).get(domain)
+    if carried is not None:
+        logger.info(f"{domain.capitalize()} unchanged since it passed, keeping its verdict")
+        return {"early_update": cast(ArchitectureState, {
+            "validation_feedback": [dict(carried)]
+        })}
+    
+    # ============ GET VALIDATION TASK ============
+    validation_tasks = state.get("architecture_domain_tasks", {}).get("validation_tasks", {})
+    domain_validation = validation_tasks.get(domain, {})
+    
+    if not domain_validation:
+        logger.info(f"No validation task for {domain}, skipping")
+        return {"early_update": cast(ArchitectureState, {
+            "validation_feedback": [_skipped_feedback(domain)]
+        })}
+    
+    # ============ GET RECOMMENDATIONS TO VALIDATE ============
+    components = state.get("architecture_components", {})
+    domain_components = components.get(domain, {})
+    recommendations = domain_components.get('recommendations', '')
+    
+    # ============ CREATE VALIDATION PROMPT ============
+    components_to_validate = domain_validation.get("components_to_validate", [])
+    validation_focus = domain_validation.get("validation_focus", "general validation")
+    
+    static_prompt = _static_validator_prompt(domain, validation_focus_description)
+    task_prompt = _VALIDATOR_TASK_TEMPLATE.substitute(
+        domain_cap=domain.capitalize(),
+        components=', '.join(components_to_validate),
+        validation_focus=validation_focus,
+        recommendations=recommendations,
+    )
+    
+    cache_key = make_key("validator", domain, static_prompt, task_prompt)
+    
+    return {
+        "cached": _VALIDATOR_CACHE.get(cache_key),
+        "cache_key": cache_key,
+        "components_to_validate": components_to_validate,
+        "messages": [
+            SystemMessage(content=static_prompt),
+            SystemMessage(content=task_prompt),
             HumanMessage(content=f"Validate these {domain} components: {', '.join(components_to_validate)}")
-        ]
-        
-        # ============ EXECUTE WITH TOOLS ============
-        tools_dict = tool_manager.get_all_tools()
-        rag_tools = {k: v for k, v in tools_dict.items() if k == "RAG_search"}
-        
-        llm_with_tools = llm_manager.get_mini_with_tools(list(rag_tools.values()))
-        
-        final_response = execute_tool_calls(
-            local_messages,
-            llm_with_tools,
-            rag_tools,
-            timeout=timeout
-        )
-        
-        validation_result = getattr(final_response, "content", "Validation completed")
-        
-        # ============ DETECT ERRORS ============
-        # Use LLM to intelligently detect if there are errors
-        has_errors = detect_errors_llm(validation_result)
-        
-        duration = time.time() - start_time
-        logger.info(f"{domain.capitalize()} validator completed in {duration:.2f}s (errors: {has_errors})")
-        
-        # ============ RETURN FEEDBACK ============
-        return cast(ArchitectureState, {
-            "validation_feedback": [{
-                "domain": domain,
-                "validation_result": validation_result,
-                "components_validated": components_to_validate,
-                "has_errors": has_errors
-            }],
-            "factual_errors_exist": has_errors
-        })
+        ],
+    }
+
+
+def _record_validator_response(plan: Dict[str, Any], final_response) -> Tuple[str, bool, Optional[int]]:
+    """
+    Read the verdict from the final message and cache it.
     
-    except Exception as e:
-        error_msg = f"Validation error: {str(e)}"
-        logger.error(error_msg, exc_info=True)
-        
-        return cast(ArchitectureState, {
-            "validation_feedback": [{
-                "domain": domain,
-                "validation_result": error_msg,
-                "components_validated": [],
-                "has_errors": True
-            }],
-            "factual_errors_exist": True
-        })
+    Only a real verdict is cached: non-empty content from a final answer
+    (no pending tool calls). Errors and incomplete or empty runs are
+    returned as failures (see _validator_update) and retried next time.
+    """
+    content = getattr(final_response, "content", "Validation completed")
+    
+    # ============ READ VERDICT ============
+    # Structured JSON verdict, keyword detection as the fallback
+    verdict = _read_verdict(content)
+    
+    if not is_incomplete_result(content) and not getattr(final_response, "tool_calls", None):
+        _VALIDATOR_CACHE.set(plan["cache_key"], verdict)
+    return verdict
+
+
+def _validator_update(
+    domain: str,
+    plan: Dict[str, Any],
+    verdict: Tuple[str, bool, Optional[int]]
+) -> ArchitectureState:
+    """State update carrying one domain's feedback entry."""
+    validation_result, has_errors, confidence = verdict
+    
+    # A failed run (rate limit, timeout, incomplete tool loop, no verdict at
+    # all) is not a pass: the domain must be validated again next iteration
+    if is_incomplete_result(validation_result):
+        has_errors = True
+    
+    # ============ RETURN FEEDBACK ============
+    feedback = {
+        "domain": domain,
+        "validation_result": validation_result,
+        "components_validated": plan["components_to_validate"],
+        "has_errors": has_errors
+    }
+    if confidence is not None:
+        feedback["confidence"] = confidence
+    
+    return cast(ArchitectureState, {
+        "validation_feedback": [feedback],
+        "factual_errors_exist": has_errors
+    })
+
+
+def _validator_error_update(domain: str, e: BaseException) -> ArchitectureState:
+    """State update for a failed validator run (logged, never raised)."""
+    error_msg = f"Validation error: {str(e)}"
+    _log_validator_failure(domain, error_msg, e)
+    
+    return cast(ArchitectureState, {
+        "validation_feedback": [{
+            "domain": domain,
+            "validation_result": error_msg,
+            "components_validated": [],
+            "has_errors": True
+        }],
+        "factual_errors_exist": True
+    })
 
 
 # ============================================================================
 # CONCRETE VALIDATOR FUNCTIONS
 # ============================================================================
 
+# What each domain validator checks. Built once at import and read-only,
+# so every validator call is a single lookup.
+VALIDATION_FOCUS = MappingProxyType({
+    "compute": (
+        "1. Service names exist and versions are correct\n"
+        "2. Instance types and sizing are appropriate\n"
+        "3. Auto Scaling configurations are valid\n"
+        "4. Best practices are followed\n"
+        "5. Configuration parameters are valid"
+    ),
+    "network": (
+        "1. VPC CIDR blocks and subnet sizing\n"
+        "2. Security Group rules are valid\n"
+        "3. Load Balancer configurations\n"
+        "4. DNS and CDN setup\n"
+        "5. Network connectivity flow"
+    ),
+    "storage": (
+        "1. S3 bucket configuration and access\n"
+        "2. EBS volume types and configurations\n"
+        "3. EFS setup and performance\n"
+        "4. Lifecycle policies\n"
+        "5. Encryption and compliance"
+    ),
+    "database": (
+        "1. Engine selection and versions\n"
+        "2. Instance sizing and types\n"
+        "3. Backup and recovery settings\n"
+        "4. High availability setup\n"
+        "5. Security and encryption"
+    ),
+})
+
+
+def get_validation_focus(domain: str) -> str:
+    """Checklist for a domain's validator (generic fallback for unknown domains)."""
+    return VALIDATION_FOCUS.get(domain, "general validation")
+
+
 def compute_validator(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
     """Validate compute domain architecture."""
-    validation_focus = """
-1. Service names exist and versions are correct
-2. Instance types and sizing are appropriate
-3. Auto Scaling configurations are valid
-4. Best practices are followed
-5. Configuration parameters are valid
-    """
     return generic_domain_validator(
-        state, "compute", validation_focus, llm_manager, tool_manager
+        state, "compute", VALIDATION_FOCUS["compute"], llm_manager, tool_manager
     )
 
 
 def network_validator(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
     """Validate network domain architecture."""
-    validation_focus = """
-1. VPC CIDR blocks and subnet sizing
-2. Security Group rules are valid
-3. Load Balancer configurations
-4. DNS and CDN setup
-5. Network connectivity flow
-    """
     return generic_domain_validator(
-        state, "network", validation_focus, llm_manager, tool_manager
+        state, "network", VALIDATION_FOCUS["network"], llm_manager, tool_manager
     )
 
 
 def storage_validator(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
     """Validate storage domain architecture."""
-    validation_focus = """
-1. S3 bucket configuration and access
-2. EBS volume types and configurations
-3. EFS setup and performance
-4. Lifecycle policies
-5. Encryption and compliance
-    """
     return generic_domain_validator(
-        state, "storage", validation_focus, llm_manager, tool_manager
+        state, "storage", VALIDATION_FOCUS["storage"], llm_manager, tool_manager
     )
 
 
 def database_validator(state: ArchitectureState, llm_manager, tool_manager) -> ArchitectureState:
     """Validate database domain architecture."""
-    validation_focus = """
-1. Engine selection and versions
-2. Instance sizing and types
-3. Backup and recovery settings
-4. High availability setup
-5. Security and encryption
-    """
     return generic_domain_validator(
-        state, "database", validation_focus, llm_manager, tool_manager
+        state, "database", VALIDATION_FOCUS["database"], llm_manager, tool_manager
+    )
+
+
+# ============================================================================
+# ALL VALIDATORS IN ONE NODE
+# ============================================================================
+# Like the architects, the four validators are independent and I/O-bound.
+# One node running all four costs the slowest validator instead of the sum:
+# a thread pool for sync graphs, asyncio.gather for async ones.
+# ============================================================================
+
+def run_all_validators(
+    state: ArchitectureState,
+    llm_manager,
+    tool_manager
+) -> ArchitectureState:
+    """
+    Run the four domain validators concurrently (thread pool).
+    
+    Sync twin of run_all_validators_async: feedback in domain order,
+    factual_errors_exist if any domain reported errors, identical RAG calls
+    across the validators run once (tool_call_scope).
+    """
+    logger.info(f"--- All Validators ({len(VALIDATION_FOCUS)} in parallel) ---")
+    
+    # Each worker runs in a copy of the caller's context so the request-scoped
+    # tool cache (a ContextVar) is visible inside the pool threads
+    with tool_call_scope(), ThreadPoolExecutor(max_workers=len(VALIDATION_FOCUS)) as pool:
+        futures = [
+            pool.submit(
+                copy_context().run,
+                generic_domain_validator, state, domain, focus, llm_manager, tool_manager
+            )
+            for domain, focus in VALIDATION_FOCUS.items()
+        ]
+        feedback = [fb for future in futures for fb in future.result().get("validation_feedback", [])]
+    
+    return cast(ArchitectureState, {
+        "validation_feedback": feedback,
+        "factual_errors_exist": any(fb.get("has_errors", False) for fb in feedback)
+    })
+
+
+async def run_all_validators_async(
+    state: ArchitectureState,
+    llm_manager,
+    tool_manager,
+    speculative: bool = False,
+    prefetch: bool = False
+) -> ArchitectureState:
+    """
+    Run the four domain validators concurrently with asyncio.gather.
+    
+    Feedback entries are concatenated in domain order; factual_errors_exist
+    is True if any domain reported errors. Identical RAG calls across the
+    validators run once (tool_call_scope).
+    
+    SPECULATIVE MODE (speculative=True):
+    The first domain that reports errors already decides the outcome - the
+    run will iterate. The validators still running are cancelled instead of
+    waiting for the slowest one; feedback from every validator that finished
+    is kept, cancelled domains simply have no entry this round.
+    
+    prefetch=True runs each validator in prefetch mode (see
+    generic_domain_validator_async).
+    """
+    logger.info(f"--- All Validators ({len(VALIDATION_FOCUS)} concurrently) ---")
+    
+    with tool_call_scope():
+        if speculative:
+            return await _run_validators_speculative(state, llm_manager, tool_manager, prefetch)
+        
+        results = await asyncio.gather(
+            *(
+                generic_domain_validator_async(
+                    state, domain, focus, llm_manager, tool_manager, prefetch=prefetch
+                )
+                for domain, focus in VALIDATION_FOCUS.items()
+            ),
+            return_exceptions=True
+        )
+    
+    feedback = []
+    for domain, result in zip(VALIDATION_FOCUS, results):
+        if isinstance(result, BaseException):
+            result = _validator_error_update(domain, result)
+        feedback.extend(result.get("validation_feedback", []))
+    
+    return cast(ArchitectureState, {
+        "validation_feedback": feedback,
+        "factual_errors_exist": any(fb.get("has_errors", False) for fb in feedback)
+    })
+
+
+async def _run_validators_speculative(
+    state: ArchitectureState,
+    llm_manager,
+    tool_manager,
+    prefetch: bool = False
+) -> ArchitectureState:
+    """Speculative half of run_all_validators_async: stop at the first error."""
+    tasks = {
+        asyncio.ensure_future(
+            generic_domain_validator_async(
+                state, domain, focus, llm_manager, tool_manager, prefetch=prefetch
+            )
+        ): domain
+        for domain, focus in VALIDATION_FOCUS.items()
+    }
+    
+    feedback_by_domain: Dict[str, Dict[str, Any]] = {}
+    has_errors = False
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            for fb in result.get("validation_feedback", []):
+                feedback_by_domain[fb.get("domain", "unknown")] = fb
+                has_errors = has_errors or fb.get("has_errors", False)
+            if has_errors:
+                break
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.info(
+                "Speculative validation: errors found, cancelled %s",
+                ", ".join(tasks[task] for task in pending)
+            )
+    
+    # Domain order, not completion order (stable prompts downstream)
+    feedback = [feedback_by_domain[d] for d in VALIDATION_FOCUS if d in feedback_by_domain]
+    return cast(ArchitectureState, {
+        "validation_feedback": feedback,
+        "factual_errors_exist": has_errors
+    })
+
+
+# ============================================================================
+# COMBINED VALIDATOR (one LLM call for all domains)
+# ============================================================================
+# The four validators share one prompt skeleton and differ only in their
+# recommendations and checklist. combined_validator sends all domains in one
+# structured request: one round-trip and one copy of the instructions
+# instead of four. Use it as a single node in place of the four above.
+# Documentation comes from ONE shared RAG tool loop (mini model, searches
+# for every domain in the same turns) rather than four per-domain loops;
+# its notes are pasted into the structured request.
+# ============================================================================
+
+# Upper bound on the research notes pasted into the combined request
+_RESEARCH_NOTES_CHARS = 6000
+
+# Static part of the shared research loop prompt (sent first, byte-identical)
+_COMBINED_RESEARCH_PROMPT = """
+You are researching AWS documentation for an architecture review.
+Use RAG_search to look up the services listed for EVERY domain below.
+Request all the searches you need in the same turn.
+
+When done, reply with concise notes per domain: the documented limits,
+configuration rules and best practices that confirm or contradict the
+proposed architecture. Do not judge the architecture yourself."""
+
+_COMBINED_VALIDATOR_PROMPT_TEMPLATE = Template("""
+You are an AWS architecture validator covering several domains at once.
+Validate each domain's proposed architecture independently.
+
+For EACH domain below:
+1. Check whether the recommendations are factually correct for AWS
+   (against the AWS Documentation Notes, when given)
+2. Flag errors, misconfigurations, or missing best practices
+3. Set has_errors to true only for real errors, not optional improvements
+4. Rate your confidence (0-100)
+
+Return exactly one validation per domain, using the domain names given.
+Then summarize across all domains: overall status (PASS/FAIL), critical
+issues that must be fixed, non-critical improvements, and recommendations
+for the next iteration (if needed).
+$domain_sections
+""")
+
+_DOMAIN_SECTION_TEMPLATE = Template("""
+## Domain: $domain
+**Components to Validate**: $components
+**Validation Focus**: $validation_focus
+**What to Check**:
+$focus_description
+
+**Proposed Architecture**:
+$recommendations
+""")
+
+
+def combined_validator(
+    state: ArchitectureState,
+    llm_manager,
+    tool_manager,
+    timeout: float = 300.0
+) -> ArchitectureState:
+    """
+    Validate all domains with a single structured LLM call.
+    
+    FLOW:
+    1. Collect each domain's validation task and recommendations
+    2. Render one prompt with a section per domain
+    3. Ask for a ValidationBatch (one DomainValidation per domain)
+    4. Emit one validation_feedback entry per domain
+    
+    Domains without a validation task are reported as skipped, exactly like
+    generic_domain_validator. Before step 3, one RAG tool loop researches
+    the docs for all domains at once (see _research_domains); without a
+    tool_manager the model relies on its own knowledge.
+    
+    The same call also writes the cross-domain summary (validation_summary).
+    It is stored as validation_synthesizer's answer for this feedback, so a
+    synthesizer node after this one is a cache hit, not another LLM call.
+    """
+    logger.info("--- Combined Validator ---")
+    start_time = time.perf_counter()
+    
+    validation_tasks = state.get("architecture_domain_tasks", {}).get("validation_tasks", {})
+    components = state.get("architecture_components", {})
+    
+    feedback = []
+    sections = []
+    components_by_domain: Dict[str, Any] = {}
+    validation_summary = None
+    clean_domains = state.get("clean_domains", {})
+    for domain in VALIDATION_FOCUS:
+        if domain in clean_domains:
+            feedback.append(dict(clean_domains[domain]))  # unchanged since it passed
+            continue
+        
+        domain_validation = validation_tasks.get(domain, {})
+        if not domain_validation:
+            feedback.append(_skipped_feedback(domain))
+            continue
+        
+        components_to_validate = domain_validation.get("components_to_validate", [])
+        components_by_domain[domain] = components_to_validate
+        sections.append(_domain_template(
+            _DOMAIN_SECTION_TEMPLATE, domain, get_validation_focus(domain)
+        ).substitute(
+            components=', '.join(components_to_validate),
+            validation_focus=domain_validation.get("validation_focus", "general validation"),
+            recommendations=components.get(domain, {}).get('recommendations', ''),
+        ))
+    
+    if not sections:
+        logger.info("No validation tasks for any domain, skipping")
+        return cast(ArchitectureState, {"validation_feedback": feedback})
+    
+    try:
+        system_prompt = _COMBINED_VALIDATOR_PROMPT_TEMPLATE.substitute(
+            domain_sections="".join(sections)
+        )
+        
+        cache_key = make_key("combined_validator", system_prompt)
+        batch = _VALIDATOR_CACHE.get(cache_key)
+        fresh = batch is None
+        if fresh:
+            messages = [SystemMessage(content=system_prompt)]
+            notes = _research_domains(sections, components_by_domain, llm_manager, tool_manager, timeout)
+            if notes:
+                messages.append(SystemMessage(
+                    content=f"\n**AWS Documentation Notes**:\n{notes[:_RESEARCH_NOTES_CHARS]}"
+                ))
+            messages.append(
+                HumanMessage(content=f"Validate these domains: {', '.join(components_by_domain)}")
+            )
+            
+            structured_llm = llm_manager.get_reasoning_structured(ValidationBatch)
+            batch = cast(ValidationBatch, structured_llm.invoke(messages))
+            if not batch or not batch.validations:
+                raise ValueError("Empty validation batch")
+        
+        verdicts = {}
+        for verdict in batch.validations:
+            domain = verdict.domain.strip().lower()
+            if domain in components_by_domain and domain not in verdicts:
+                verdicts[domain] = verdict  # Ignore unknown domains and repeats
+        
+        # Only complete batches are worth reusing
+        if fresh and len(verdicts) == len(components_by_domain):
+            _VALIDATOR_CACHE.set(cache_key, batch)
+        
+        for domain, components_to_validate in components_by_domain.items():
+            verdict = verdicts.get(domain)
+            if verdict is None:
+                # A silently dropped domain must not count as a pass
+                logger.warning(f"Combined validator returned no verdict for {domain}")
+                feedback.append({
+                    "domain": domain,
+                    "validation_result": f"No verdict returned for {domain}",
+                    "components_validated": components_to_validate,
+                    "has_errors": True
+                })
+                continue
+            feedback.append({
+                "domain": domain,
+                "validation_result": verdict.validation_result,
+                "components_validated": components_to_validate,
+                "has_errors": verdict.has_errors or is_incomplete_result(verdict.validation_result),
+                "confidence": verdict.confidence
+            })
+        
+        validation_summary = f"Overall validation status: {batch.overall_status}\n\n{batch.summary}"
+        synthesizer_plan = _plan_synthesizer_call(cast(ArchitectureState, {"validation_feedback": feedback}))
+        if "cache_key" in synthesizer_plan:
+            _NODE_CACHE.set(synthesizer_plan["cache_key"], validation_summary)
+    
+    except Exception as e:
+        error_msg = f"Validation error: {str(e)}"
+        _log_validator_failure("combined", error_msg, e)
+        feedback.extend(
+            {
+                "domain": domain,
+                "validation_result": error_msg,
+                "components_validated": [],
+                "has_errors": True
+            }
+            for domain in components_by_domain
+        )
+    
+    has_errors = any(fb["has_errors"] for fb in feedback)
+    logger.info(
+        "Combined validator completed in %.2fs (errors: %s)",
+        time.perf_counter() - start_time, has_errors
     )
+    
+    update = {
+        "validation_feedback": feedback,
+        "factual_errors_exist": has_errors
+    }
+    if validation_summary is not None:
+        update["validation_summary"] = validation_summary
+    return cast(ArchitectureState, update)
+
+
+def _research_domains(
+    sections: list,
+    components_by_domain: Dict[str, Any],
+    llm_manager,
+    tool_manager,
+    timeout: float
+) -> str:
+    """
+    One RAG tool loop for every domain; returns the model's notes.
+    
+    Failures are not fatal: the combined request then goes out without
+    documentation notes ("" is returned), as it did before this step.
+    """
+    if tool_manager is None:
+        return ""
+    try:
+        rag_tools = _rag_tools(tool_manager)
+        if not rag_tools:
+            return ""
+        final_response = execute_tool_calls(
+            [
+                SystemMessage(content=_COMBINED_RESEARCH_PROMPT),
+                SystemMessage(content="".join(sections)),
+                HumanMessage(content=f"Research these domains: {', '.join(components_by_domain)}")
+            ],
+            llm_manager.get_mini_with_tools(list(rag_tools.values())),
+            rag_tools,
+            timeout=timeout
+        )
+        notes = str(getattr(final_response, "content", ""))
+        if is_incomplete_result(notes):
+            logger.warning(f"Combined validator research incomplete: {notes[:200]}")
+            return ""
+        return notes
+    except Exception as e:
+        logger.warning(f"Combined validator research failed, validating without docs: {e}")
+        return ""
 
 
 def validation_synthesizer(
@@ -342,62 +1072,168 @@ def validation_synthesizer(
     logger.info("--- Validation Synthesizer ---")
     
     try:
-        all_feedback = state.get("validation_feedback", [])
+        plan = _plan_synthesizer_call(state)
+        if "early_update" in plan:
+            return plan["early_update"]
         
-        if not all_feedback:
-            return cast(ArchitectureState, {
-                "validation_summary": "No validation feedback available"
-            })
+        validation_summary = plan["cached"]
+        if validation_summary is None:
+            reasoning_llm = llm_manager.get_reasoning_llm()
+            response = reasoning_llm.invoke(plan["messages"])
+            
+            if not response or not hasattr(response, "content"):
+                raise ValueError("Empty response from validation synthesizer")
+            
+            validation_summary = response.content
+            _NODE_CACHE.set(plan["cache_key"], validation_summary)
         
-        # ============ PREPARE FEEDBACK FOR SUMMARY ============
-        feedback_summaries = []
-        error_count = 0
+        logger.info("Validation synthesizer completed")
+        
+        return cast(ArchitectureState, {
+            "validation_summary": validation_summary
+        })
+    
+    except Exception as e:
+        return _synthesizer_error_update(e)
+
+
+async def validation_synthesizer_async(
+    state: ArchitectureState,
+    llm_manager,
+    on_chunk: Optional[Callable[[str], None]] = None
+) -> ArchitectureState:
+    """
+    Async, streaming version of validation_synthesizer.
+    
+    The summary is the longest reasoning-model answer of an iteration.
+    Streaming it does not make it finish sooner, but on_chunk (e.g. a UI or
+    log sink) sees text as soon as the model produces it. Same prompt,
+    cache and state update as the sync node.
+    """
+    logger.info("--- Validation Synthesizer ---")
+    
+    try:
+        plan = _plan_synthesizer_call(state)
+        if "early_update" in plan:
+            if on_chunk is not None:
+                on_chunk(plan["early_update"]["validation_summary"])
+            return plan["early_update"]
         
-        for feedback in all_feedback:
-            domain = feedback.get("domain", "unknown")
-            has_errors = feedback.get("has_errors", False)
-            result = feedback.get("validation_result", "")[:300]
+        validation_summary = plan["cached"]
+        if validation_summary is None:
+            reasoning_llm = llm_manager.get_reasoning_llm()
+            chunks = []
+            async for chunk in reasoning_llm.astream(plan["messages"]):
+                text = getattr(chunk, "content", "")
+                if text:
+                    chunks.append(text)
+                    if on_chunk is not None:
+                        on_chunk(text)
             
-            if has_errors:
-                error_count += 1
+            if not chunks:
+                raise ValueError("Empty response from validation synthesizer")
             
-            feedback_summaries.append(f"""
-**{domain.upper()}**: {result}...
-            """)
+            validation_summary = "".join(chunks)
+            _NODE_CACHE.set(plan["cache_key"], validation_summary)
+        elif on_chunk is not None:
+            on_chunk(validation_summary)  # cached: one chunk with everything
         
-        # ============ CREATE SUMMARY PROMPT ============
-        system_prompt = f"""
-You are synthesizing validation feedback from 4 domain validators.
+        logger.info("Validation synthesizer completed")
+        
+        return cast(ArchitectureState, {
+            "validation_summary": validation_summary
+        })
+    
+    except Exception as e:
+        return _synthesizer_error_update(e)
 
-**Validation Feedback**:
-{''.join(feedback_summaries)}
 
-**Error Count**: {error_count} domains have issues
+# Static part of the synthesizer prompt (sent first, byte-identical)
+_SYNTHESIZER_PROMPT = """
+You are synthesizing validation feedback from 4 domain validators.
 
 Create a concise summary that includes:
 1. Overall validation status (passed/failed)
 2. Critical issues that must be fixed
 3. Non-critical improvements
-4. Recommendations for next iteration (if needed)
-        """
-        
-        messages = [SystemMessage(content=system_prompt)]
-        reasoning_llm = llm_manager.get_reasoning_llm()
-        response = reasoning_llm.invoke(messages)
-        
-        if not response or not hasattr(response, "content"):
-            raise ValueError("Empty response from validation synthesizer")
-        
-        validation_summary = response.content
+4. Recommendations for next iteration (if needed)"""
+
+
+def _plan_synthesizer_call(state: ArchitectureState) -> Dict[str, Any]:
+    """
+    Everything before the LLM call: feedback rendering, prompt, cache lookup.
+    
+    Returns a plan dict with either "early_update" (nothing to synthesize:
+    no feedback, or at most one validated domain) or "cached" (a cached
+    summary or None), "messages" and "cache_key".
+    """
+    # Stable domain order -> byte-identical prompt for identical feedback
+    all_feedback = sorted(
+        state.get("validation_feedback", []),
+        key=lambda fb: fb.get("domain", "unknown")
+    )
+    
+    if not all_feedback:
+        return {"early_update": cast(ArchitectureState, {
+            "validation_summary": "No validation feedback available"
+        })}
+    
+    # Nothing to synthesize: no domain validated, or only one. Skip the
+    # reasoning-model call and report that domain's verdict as is.
+    validated = [fb for fb in all_feedback if fb.get("status") != "skipped"]
+    if not validated:
+        return {"early_update": cast(ArchitectureState, {
+            "validation_summary": "No validation performed"
+        })}
+    if len(validated) == 1:
+        only = validated[0]
+        status = "failed" if only.get("has_errors", False) else "passed"
+        return {"early_update": cast(ArchitectureState, {
+            "validation_summary": (
+                f"Overall validation status: {status}\n\n"
+                f"**{only.get('domain', 'unknown').upper()}**: {only.get('validation_result', '')}"
+            )
+        })}
+    
+    # ============ PREPARE FEEDBACK FOR SUMMARY ============
+    # One buffer with a total budget: the prompt stays bounded no matter
+    # how many feedback entries arrive. Errors are still counted for all.
+    feedback_buffer = io.StringIO()
+    error_count = 0
+    
+    for feedback in all_feedback:
+        if feedback.get("has_errors", False):
+            error_count += 1
         
-        logger.info("Validation synthesizer completed")
+        if feedback_buffer.tell() >= MAX_FEEDBACK_CHARS:
+            continue
         
-        return cast(ArchitectureState, {
-            "validation_summary": validation_summary
-        })
+        domain = feedback.get("domain", "unknown")
+        result = feedback.get("validation_result", "")[:300]
+        feedback_buffer.write(f"\n**{domain.upper()}**: {result}...\n")
     
-    except Exception as e:
-        logger.error(f"Validation synthesizer error: {e}", exc_info=True)
-        return cast(ArchitectureState, {
-            "validation_summary": f"Error synthesizing feedback: {str(e)}"
-        })
\ No newline at end of file
+    # ============ CREATE SUMMARY PROMPT ============
+    # Static instructions first (cacheable prefix), feedback last
+    feedback_prompt = f"""
+**Validation Feedback**:
+{feedback_buffer.getvalue()}
+
+**Error Count**: {error_count} domains have issues"""
+    
+    cache_key = make_key("validation_synthesizer", _SYNTHESIZER_PROMPT, feedback_prompt)
+    return {
+        "cached": _NODE_CACHE.get(cache_key),
+        "cache_key": cache_key,
+        "messages": [
+            SystemMessage(content=_SYNTHESIZER_PROMPT),
+            SystemMessage(content=feedback_prompt)
+        ],
+    }
+
+
+def _synthesizer_error_update(e: BaseException) -> ArchitectureState:
+    """State update for a failed synthesizer run (logged, never raised)."""
+    logger.error(f"Validation synthesizer error: {e}", exc_info=True)
+    return cast(ArchitectureState, {
+        "validation_summary": f"Error synthesizing feedback: {str(e)}"
+    })
@@ -6,13 +6,17 @@ Embeds Azure docs from local repo into ChromaDB using Ollama (nomic-embed-text).
 
 import os
 import sys
-import glob
+import asyncio
 import time
 import yaml
+import httpx
 import logging
 import argparse
-import gc
+import hashlib
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from tqdm import tqdm
 
 # Connect to existing ChromaDB
@@ -70,37 +74,64 @@ SKIP_FILES = {
 # HELPER FUNCTIONS
 # ============================================================================
 
+# libyaml's C loader is ~10x faster on small frontmatter blocks; fall back
+# to the pure-Python loader where PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Frontmatter blocks are a few hundred bytes; one read of this size finds
+# the closing "---" for nearly every file
+FRONTMATTER_HEAD_BYTES = 8192
+
+
+def _decode(data: bytes) -> str:
+    """UTF-8 decode with the newline translation text-mode open() applied."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
 def parse_markdown_with_frontmatter(file_path: str) -> Optional[Dict[str, Any]]:
     """
     Parse a markdown file, extracting YAML frontmatter and content.
     Returns dict with 'content', 'title', 'service' or None if invalid.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            raw_content = f.read()
-        
-        # Check if file has frontmatter
-        if not raw_content.startswith("---"):
-            # No frontmatter, just return content with filename as title
-            return {
-                "content": raw_content,
-                "title": os.path.basename(file_path).replace(".md", "").replace("-", " ").title(),
-                "service": "unknown"
-            }
-        
-        # Split frontmatter and content
-        parts = raw_content.split("---", 2)
-        if len(parts) < 3:
-            return None  # Malformed
+        with open(file_path, "rb") as f:
+            head = f.read(FRONTMATTER_HEAD_BYTES)
+            
+            # Check if file has frontmatter
+            if not head.startswith(b"---"):
+                # No frontmatter, just return content with filename as title
+                return {
+                    "content": _decode(head + f.read()),
+                    "title": os.path.basename(file_path).replace(".md", "").replace("-", " ").title(),
+                    "service": "unknown"
+                }
             
-        frontmatter_str = parts[1]
-        content = parts[2].strip()
+            # Closing marker: nearly always within the head
+            end = head.find(b"---", 3)
+            if end != -1 and os.fstat(f.fileno()).st_size - (end + 3) < 100:
+                return None  # Stub: the body cannot reach 100 chars, skip reading it
+            
+            raw = head + f.read()
+            if end == -1:
+                end = raw.find(b"---", 3)
+                if end == -1:
+                    return None  # Malformed
         
-        if len(content) < 100:
+        # Bytes >= characters: a short body is a stub without decoding it
+        content_bytes = raw[end + 3:]
+        if len(content_bytes.strip()) < 100:
             return None  # Skip empty/stub files
-            
+        
+        content = _decode(content_bytes).strip()
+        if len(content) < 100:
+            return None
+        frontmatter_str = _decode(raw[3:end])
+        
         try:
-            metadata = yaml.safe_load(frontmatter_str) or {}
+            metadata = yaml.load(frontmatter_str, Loader=YamlLoader) or {}
         except yaml.YAMLError:
             metadata = {}
             
@@ -114,8 +145,9 @@ def parse_markdown_with_frontmatter(file_path: str) -> Optional[Dict[str, Any]]:
         logger.warning(f"Failed to parse {file_path}: {e}")
         return None
 
+@lru_cache(maxsize=None)
 def get_splitter():
-    """Create markdown-aware text splitter"""
+    """Create markdown-aware text splitter (once per process)"""
     return RecursiveCharacterTextSplitter(
         chunk_size=1000,
         chunk_overlap=150,
@@ -135,96 +167,226 @@ def get_splitter():
 # MAIN INGESTION LOGIC
 # ============================================================================
 
+def iter_markdown_files(root: str):
+    """
+    Yield the .md files under root, pruning SKIP_DIRS during the walk.
+    
+    Matches directory NAMES (so "media/" is skipped but "multimedia.md"
+    is not) and saves the stat calls of descending into skipped trees.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(".md") and filename not in SKIP_FILES:
+                yield os.path.join(dirpath, filename)
+
+
+def parse_and_split(file_path: str, domain: str, service_dir: str) -> List[Document]:
+    """
+    Parse one markdown file and split it into chunks.
+    
+    Pure function of its arguments, so it can run in a worker process:
+    YAML parsing and splitting are CPU-bound and dominate pre-embed time.
+    """
+    data = parse_markdown_with_frontmatter(file_path)
+    if not data:
+        return []
+        
+    # Create base doc
+    doc = Document(
+        page_content=data["content"],
+        metadata={
+            "source": file_path,
+            "domain": domain,
+            "service": service_dir, # Use dir name as consistent service tag
+            "title": data["title"],
+            "ms_service": data["service"]
+        }
+    )
+    
+    # Split
+    chunks = get_splitter().split_documents([doc])
+    for i, chunk in enumerate(chunks):
+        chunk.metadata["chunk_index"] = i
+    return chunks
+
+
+def chunk_id(doc: Document) -> str:
+    """
+    Stable id for a chunk: same file + chunk index -> same id.
+    
+    Upserting under stable ids makes re-runs idempotent - an interrupted
+    ingest can simply be restarted without duplicating chunks.
+    """
+    key = f"{doc.metadata['source']}:{doc.metadata['chunk_index']}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def upsert_batch(db: Chroma, batch: List[Document], texts: List[str], vectors: List[List[float]]):
+    """Write precomputed vectors straight to the Chroma collection (no re-embedding)."""
+    db._collection.upsert(
+        ids=[chunk_id(doc) for doc in batch],
+        embeddings=vectors,
+        documents=texts,
+        metadatas=[doc.metadata for doc in batch],
+    )
+
+
+def batch_retry_delay(batch_len: int, attempt: int, max_retries: int, e: Exception) -> Optional[int]:
+    """
+    Log a failed batch attempt and return the backoff before the next one
+    (exponential, max 30s), or None once the retries are used up.
+    Shared by add_batch and aadd_batch, which only differ in how they sleep.
+    """
+    if attempt == max_retries:
+        logger.error(f"Failed to ingest batch of {batch_len} chunks after {attempt + 1} attempts. Skipping. Error: {e}")
+        return None
+    wait_time = min(2 ** (attempt + 1), 30)
+    logger.warning(f"Batch failed (attempt {attempt + 1}/{max_retries + 1}). Retrying in {wait_time}s. Error: {e}")
+    return wait_time
+
+
+def add_batch(db: Chroma, batch: List[Document], max_retries: int = 3) -> bool:
+    """
+    Embed and store one batch, retrying with backoff (see batch_retry_delay).
+    Returns False if the batch had to be skipped.
+    """
+    texts = [doc.page_content for doc in batch]
+    for attempt in range(max_retries + 1):
+        try:
+            upsert_batch(db, batch, texts, db.embeddings.embed_documents(texts))
+            return True
+        except Exception as e:
+            wait_time = batch_retry_delay(len(batch), attempt, max_retries, e)
+            if wait_time is None:
+                return False
+            time.sleep(wait_time)
+    return False
+
+
+async def aadd_batch(
+    db: Chroma,
+    batch: List[Document],
+    semaphore: asyncio.Semaphore,
+    max_retries: int = 3
+) -> bool:
+    """
+    Async add_batch: embed with aembed_documents, then upsert the precomputed
+    vectors straight into the collection (Chroma's own add path would embed
+    again, serially). The semaphore bounds concurrent requests to Ollama.
+    """
+    texts = [doc.page_content for doc in batch]
+    for attempt in range(max_retries + 1):
+        try:
+            async with semaphore:
+                vectors = await db.embeddings.aembed_documents(texts)
+            upsert_batch(db, batch, texts, vectors)
+            return True
+        except Exception as e:
+            wait_time = batch_retry_delay(len(batch), attempt, max_retries, e)
+            if wait_time is None:
+                return False
+            await asyncio.sleep(wait_time)
+    return False
+
+
+async def aadd_batches(db: Chroma, batches: List[List[Document]], concurrency: int):
+    """Embed batches concurrently, at most `concurrency` requests in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    with tqdm(total=len(batches), desc="Embedding", unit="batch") as progress:
+        async def run(batch):
+            await aadd_batch(db, batch, semaphore)
+            progress.update(1)
+        await asyncio.gather(*(run(batch) for batch in batches))
+
+
+def flush_batches(
+    db: Chroma,
+    pending: List[Document],
+    batch_size: int,
+    final: bool = False,
+    concurrency: int = 1,
+    runner: Optional[asyncio.Runner] = None
+):
+    """
+    Embed full batches from the front of `pending` (all of it if final).
+    
+    Chunks from several directories share batches, so a directory with a
+    handful of files no longer costs its own under-filled embedding call.
+    With concurrency > 1 the batches are embedded in parallel on `runner`.
+    
+    WHY ONE RUNNER? The embeddings' async httpx client keeps pooled
+    keep-alive connections bound to the event loop that opened them. A fresh
+    asyncio.run() per flush would hand those to a closed loop ("Event loop
+    is closed"), so repeated flushes must share one loop.
+    """
+    limit = len(pending) if final else len(pending) - len(pending) % batch_size
+    if limit <= 0:
+        return
+    
+    batches = [pending[i:i + batch_size] for i in range(0, limit, batch_size)]
+    if concurrency > 1:
+        run = runner.run if runner is not None else asyncio.run
+        run(aadd_batches(db, batches, concurrency))
+    else:
+        for batch in tqdm(batches, desc="Embedding", unit="batch"):
+            add_batch(db, batch)
+    
+    del pending[:limit]
+
+
 def process_directory(
     base_path: str,
     service_dir: str, 
     domain: str,
     db: Chroma,
-    batch_size: int = 20
+    pending: List[Document],
+    batch_size: int = 128,
+    concurrency: int = 1,
+    pool: Optional[ProcessPoolExecutor] = None,
+    runner: Optional[asyncio.Runner] = None
 ):
     """
-    Process a single service directory.
+    Parse and chunk a single service directory into `pending`, then embed
+    every full batch. The caller flushes the remainder at the end.
     """
     full_path = os.path.join(base_path, service_dir)
     if not os.path.exists(full_path):
         logger.warning(f"Directory not found (skipping): {full_path}")
         return
 
-    # Find all .md files
-    files = glob.glob(os.path.join(full_path, "**/*.md"), recursive=True)
+    # Find all .md files (skipped directories are never entered)
+    files = list(iter_markdown_files(full_path))
     if not files:
         logger.info(f"No markdown files in {service_dir}")
         return
 
     logger.info(f"Processing {service_dir} ({len(files)} files)...")
     
-    splitter = get_splitter()
-    documents_to_embed = []
-    
-    # Check if we should skip this directory if already fully ingested?
-    # Hard to know "fully", so we'll check individual chunks or just resume.
-    # For now, simplistic check: if DB has > 0 docs for this service, user might want to skip.
-    # But let's assume valid upsert or just append.
-    
-    # 1. Parse and Chunk
-    for file_path in tqdm(files, desc=f"Parsing {service_dir}", unit="file"):
-        if any(skip in file_path for skip in SKIP_DIRS):
-            continue
-        if os.path.basename(file_path) in SKIP_FILES:
-            continue
-            
-        data = parse_markdown_with_frontmatter(file_path)
-        if not data:
-            continue
-            
-        # Create base doc
-        doc = Document(
-            page_content=data["content"],
-            metadata={
-                "source": file_path,
-                "domain": domain,
-                "service": service_dir, # Use dir name as consistent service tag
-                "title": data["title"],
-                "ms_service": data["service"]
-            }
+    # 1. Parse and Chunk (in the worker pool if there is one)
+    if pool is not None:
+        results = pool.map(
+            parse_and_split, files, repeat(domain), repeat(service_dir), chunksize=32
         )
-        
-        # Split
-        chunks = splitter.split_documents([doc])
-        for i, chunk in enumerate(chunks):
-            chunk.metadata["chunk_index"] = i
-            documents_to_embed.append(chunk)
+    else:
+        results = (parse_and_split(file_path, domain, service_dir) for file_path in files)
+    
+    # 2. Embed and Store every full batch as soon as enough are queued: the
+    # pool keeps parsing the rest of the directory meanwhile. Leftovers ride
+    # with the next directory.
+    flush_at = batch_size * max(concurrency, 1)
+    chunk_count = 0
+    for chunks in tqdm(results, total=len(files), desc=f"Parsing {service_dir}", unit="file"):
+        pending.extend(chunks)
+        chunk_count += len(chunks)
+        if len(pending) >= flush_at:
+            flush_batches(db, pending, batch_size, concurrency=concurrency, runner=runner)
 
-    if not documents_to_embed:
+    if not chunk_count:
         return
 
-    # 2. Embed and Store in Batches
-    total_batches = (len(documents_to_embed) + batch_size - 1) // batch_size
-    logger.info(f"Embedding {len(documents_to_embed)} chunks in {total_batches} batches...")
-    
-    for i in tqdm(range(0, len(documents_to_embed), batch_size), desc=f"Embedding {service_dir}", unit="batch"):
-        batch = documents_to_embed[i:i+batch_size]
-        
-        retry_count = 0
-        max_retries = 3
-        while retry_count <= max_retries:
-            try:
-                db.add_documents(batch)
-                break
-            except Exception as e:
-                retry_count += 1
-                wait_time = 2 ** retry_count
-                logger.warning(f"Batch failed (attempt {retry_count}/{max_retries}). Retrying in {wait_time}s. Error: {e}")
-                time.sleep(wait_time)
-                if retry_count > max_retries:
-                    logger.error(f"Failed to ingest batch starting at index {i} for {service_dir}. Skipping.")
-        
-        # Memory optimization: excessive sleep + GC
-        time.sleep(0.5) 
-
-    # Force cleanup after each directory
-    del documents_to_embed
-    gc.collect()
+    logger.info(f"Queued {chunk_count} chunks from {service_dir} ({len(pending)} pending)")
+    flush_batches(db, pending, batch_size, concurrency=concurrency, runner=runner)
 
 
 def main():
@@ -232,7 +394,9 @@ def main():
     parser.add_argument("--docs-path", default=os.path.expanduser("~/Desktop/Projects/MTech/azure-docs/articles"), help="Path to articles")
     parser.add_argument("--output-dir", default="./chroma_db_AzureDocs", help="ChromaDB persist directory")
     parser.add_argument("--domains", default="all", help="Comma-separated domains (compute,network,storage,database) or 'all'")
-    parser.add_argument("--batch-size", type=int, default=20, help="Batch size for embedding")
+    parser.add_argument("--batch-size", type=int, default=128, help="Batch size for embedding")
+    parser.add_argument("--concurrency", type=int, default=4, help="Embedding requests in flight (1 = sequential)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Parser processes (1 = parse in the main process)")
     
     args = parser.parse_args()
     
@@ -244,8 +408,16 @@ def main():
 
     # 2. Initialize Chroma + Ollama
     logger.info("Initializing OllamaEmbeddings (model='nomic-embed-text')...")
+    # Pooled keep-alive connections: --concurrency requests share them
     embeddings = OllamaEmbeddings(
         model="nomic-embed-text",
+        client_kwargs={
+            "limits": httpx.Limits(
+                max_connections=max(args.concurrency, 1),
+                max_keepalive_connections=max(args.concurrency, 1),
+                keepalive_expiry=300.0,
+            ),
+        },
     )
     logger.info(f"Initializing ChromaDB at {args.output_dir}...")
     db = Chroma(
@@ -254,27 +426,38 @@ def main():
         embedding_function=embeddings
     )
 
-    # 3. Process
-    for domain in target_domains:
-        if domain not in DOMAIN_MAP:
-            logger.warning(f"Unknown domain: {domain}")
-            continue
+    # 3. Process (one event loop for every async flush, see flush_batches)
+    pending: List[Document] = []
+    pool = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    runner = asyncio.Runner()
+    try:
+        for domain in target_domains:
+            if domain not in DOMAIN_MAP:
+                logger.warning(f"Unknown domain: {domain}")
+                continue
+                
+            logger.info(f"=== PROCESSING DOMAIN: {domain.upper()} ===")
+            directories = DOMAIN_MAP[domain]
             
-        logger.info(f"=== PROCESSING DOMAIN: {domain.upper()} ===")
-        directories = DOMAIN_MAP[domain]
+            for service_dir in directories:
+                process_directory(
+                    base_path=args.docs_path,
+                    service_dir=service_dir,
+                    domain=domain,
+                    db=db,
+                    pending=pending,
+                    batch_size=args.batch_size,
+                    concurrency=args.concurrency,
+                    pool=pool,
+                    runner=runner
+                )
         
-        for service_dir in directories:
-            process_directory(
-                base_path=args.docs_path,
-                service_dir=service_dir,
-                domain=domain,
-                db=db,
-                batch_size=args.batch_size
-            )
-            
-            # Extra pause between directories
-            time.sleep(2.0)
-            gc.collect()
+        # 4. Embed whatever is left over
+        flush_batches(db, pending, args.batch_size, final=True, concurrency=args.concurrency, runner=runner)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        runner.close()
     
     logger.info("Done!")
 